@@ -0,0 +1,33 @@
+"""add_task_comments_task_created_index
+
+Revision ID: 4c1e9a7b2d30
+Revises: 1826eab43703
+Create Date: 2026-10-16 09:12:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1e9a7b2d30"
+down_revision: Union[str, Sequence[str], None] = "1826eab43703"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index comments by (task_id, created_at) so threads are read in index order."""
+    op.create_index(
+        "ix_comments_task_created",
+        "task_comments",
+        ["task_id", "created_at"],
+        unique=False,
+        schema="faros",
+    )
+
+
+def downgrade() -> None:
+    """Drop the comment thread index."""
+    op.drop_index("ix_comments_task_created", table_name="task_comments", schema="faros")
@@ -0,0 +1,71 @@
+"""add_task_list_indexes
+
+Revision ID: 5e1c9b7a3f62
+Revises: d3a8f0e6b215
+Create Date: 2026-10-16 15:08:32.671940
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1c9b7a3f62"
+down_revision: Union[str, Sequence[str], None] = "d3a8f0e6b215"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, columns) of the owner-leading btree indexes
+BTREE_INDEXES = [
+    ("ix_tasks_user_created", ["user_id", "created_at"]),
+    ("ix_tasks_user_due", ["user_id", "due_date"]),
+    ("ix_tasks_user_completed_due", ["user_id", "completed", "due_date"]),
+    ("ix_tasks_user_priority", ["user_id", "priority"]),
+]
+
+
+def upgrade() -> None:
+    """Index the task list filters and sorts, built without locking tasks."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, columns in BTREE_INDEXES:
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                unique=False,
+                schema="faros",
+                postgresql_concurrently=True,
+            )
+        op.create_index(
+            "ix_tasks_tags_gin",
+            "tasks",
+            ["tags"],
+            unique=False,
+            schema="faros",
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_title_trgm",
+            "tasks",
+            ["title"],
+            unique=False,
+            schema="faros",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the task list indexes (pg_trgm is left installed)."""
+    with op.get_context().autocommit_block():
+        for name in ["ix_tasks_title_trgm", "ix_tasks_tags_gin"] + [
+            name for name, _ in reversed(BTREE_INDEXES)
+        ]:
+            op.drop_index(
+                name, table_name="tasks", schema="faros", postgresql_concurrently=True
+            )
@@ -0,0 +1,43 @@
+"""add_tasks_description_trgm_index
+
+Revision ID: 8a4d2f6c1e93
+Revises: 5e1c9b7a3f62
+Create Date: 2026-10-16 15:52:17.093486
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4d2f6c1e93"
+down_revision: Union[str, Sequence[str], None] = "5e1c9b7a3f62"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Trigram index on description so title-or-description search is indexable."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_description_trgm",
+            "tasks",
+            ["description"],
+            unique=False,
+            schema="faros",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the description trigram index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_description_trgm",
+            table_name="tasks",
+            schema="faros",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,33 @@
+"""add_task_files_sha256
+
+Revision ID: 9f3b6d21c8e4
+Revises: 4c1e9a7b2d30
+Create Date: 2026-10-16 11:03:27.540912
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9f3b6d21c8e4"
+down_revision: Union[str, Sequence[str], None] = "4c1e9a7b2d30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add nullable sha256 digest column; existing files keep NULL."""
+    op.add_column(
+        "task_files",
+        sa.Column("sha256", sa.String(length=64), nullable=True),
+        schema="faros",
+    )
+
+
+def downgrade() -> None:
+    """Drop sha256 digest column."""
+    op.drop_column("task_files", "sha256", schema="faros")
@@ -0,0 +1,44 @@
+"""add_users_verification_code_index
+
+Revision ID: b7e2c4a91d58
+Revises: 9f3b6d21c8e4
+Create Date: 2026-10-16 13:41:09.227615
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2c4a91d58"
+down_revision: Union[str, Sequence[str], None] = "9f3b6d21c8e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Partial unique index on pending verification codes, built without locking users."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_verification_code",
+            "users",
+            ["verification_code"],
+            unique=True,
+            schema="faros",
+            postgresql_where=sa.text("verification_code IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the verification code index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_verification_code",
+            table_name="users",
+            schema="faros",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,67 @@
+"""hash_users_verification_code
+
+Revision ID: d3a8f0e6b215
+Revises: b7e2c4a91d58
+Create Date: 2026-10-16 14:26:51.804371
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a8f0e6b215"
+down_revision: Union[str, Sequence[str], None] = "b7e2c4a91d58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store verification codes as SHA-256 digests behind a hash index.
+
+    Pending codes are hashed in place, so links already emailed keep working.
+    """
+    op.drop_index("ix_users_verification_code", table_name="users", schema="faros")
+    op.alter_column(
+        "users",
+        "verification_code",
+        type_=sa.LargeBinary(length=32),
+        postgresql_using="sha256(convert_to(verification_code, 'UTF8'))",
+        schema="faros",
+    )
+    op.create_index(
+        "ix_users_verification_code",
+        "users",
+        ["verification_code"],
+        unique=False,
+        schema="faros",
+        postgresql_using="hash",
+        postgresql_where=sa.text("verification_code IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Revert to a plain string column.
+
+    Digests can't be turned back into tokens, so pending verification links are
+    cleared and users have to request a new one.
+    """
+    op.drop_index("ix_users_verification_code", table_name="users", schema="faros")
+    op.alter_column(
+        "users",
+        "verification_code",
+        type_=sa.String(),
+        postgresql_using="NULL",
+        schema="faros",
+    )
+    op.create_index(
+        "ix_users_verification_code",
+        "users",
+        ["verification_code"],
+        unique=True,
+        schema="faros",
+        postgresql_where=sa.text("verification_code IS NOT NULL"),
+    )
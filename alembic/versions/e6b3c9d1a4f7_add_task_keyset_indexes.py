@@ -0,0 +1,61 @@
+"""add_task_keyset_indexes
+
+Revision ID: e6b3c9d1a4f7
+Revises: 8a4d2f6c1e93
+Create Date: 2026-10-16 17:20:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b3c9d1a4f7"
+down_revision: Union[str, Sequence[str], None] = "8a4d2f6c1e93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index the (sort value, id) keysets, then drop the narrower created index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_id",
+            "tasks",
+            ["user_id", "id"],
+            unique=False,
+            schema="faros",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_user_created_id",
+            "tasks",
+            ["user_id", "created_at", "id"],
+            unique=False,
+            schema="faros",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_created",
+            table_name="tasks",
+            schema="faros",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the (user_id, created_at) index and drop the keyset indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_created",
+            "tasks",
+            ["user_id", "created_at"],
+            unique=False,
+            schema="faros",
+            postgresql_concurrently=True,
+        )
+        for name in ["ix_tasks_user_created_id", "ix_tasks_user_id"]:
+            op.drop_index(
+                name, table_name="tasks", schema="faros", postgresql_concurrently=True
+            )
@@ -0,0 +1,68 @@
+"""add_task_sort_keyset_indexes
+
+Revision ID: f2a7d4b8c6e1
+Revises: e6b3c9d1a4f7
+Create Date: 2026-10-16 19:04:51.527318
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a7d4b8c6e1"
+down_revision: Union[str, Sequence[str], None] = "e6b3c9d1a4f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match db_models.PRIORITY_RANK as rendered, or the planner won't use it
+PRIORITY_RANK = sa.text(
+    "(CASE priority WHEN 'low' THEN 0 WHEN 'medium' THEN 1 WHEN 'high' THEN 2 END)"
+)
+
+
+def upgrade() -> None:
+    """Index the due_date and priority keysets, then drop the narrower due index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_due_id",
+            "tasks",
+            ["user_id", "due_date", "id"],
+            unique=False,
+            schema="faros",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_user_priority_rank",
+            "tasks",
+            ["user_id", PRIORITY_RANK, "id"],
+            unique=False,
+            schema="faros",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_due",
+            table_name="tasks",
+            schema="faros",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the (user_id, due_date) index and drop the keyset indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_due",
+            "tasks",
+            ["user_id", "due_date"],
+            unique=False,
+            schema="faros",
+            postgresql_concurrently=True,
+        )
+        for name in ["ix_tasks_user_priority_rank", "ix_tasks_user_due_id"]:
+            op.drop_index(
+                name, table_name="tasks", schema="faros", postgresql_concurrently=True
+            )
@@ -29,6 +29,26 @@ def get_user_id_or_ip(request: Request) -> str:
     return identifier
 
 
+def get_ip_and_username(request: Request) -> str:
+    """
+    Rate limit key for login attempts: client IP plus attempted username.
+    Users behind a shared NAT get separate buckets, so one brute-forcer
+    doesn't lock everyone on that IP out of their own accounts.
+    The username is stashed in request.state by the login route's body
+    dependency, so the body is never parsed twice.
+    """
+    ip = get_remote_address(request)
+    username = getattr(request.state, "login_username", "")
+    identifier = f"ip_{ip}:user_{username}"
+    logger.debug(f"Rate limit key: {identifier}")
+    return identifier
+
+
+# Moving window: limits are enforced over a true rolling period, so a client
+# can't burst 2x the limit across a fixed-window boundary. On Redis, limits
+# implements this as a single atomic Lua script per check.
+RATE_LIMIT_STRATEGY = "moving-window"
+
 # Check if we're running tests
 TESTING = os.getenv("TESTING", "false").lower() == "true"
 
@@ -62,7 +82,7 @@ else:
             key_func=get_user_id_or_ip,
             default_limits=["1000/hour"],
             # No storage_uri = in-memory storage
-            strategy="fixed-window",
+            strategy=RATE_LIMIT_STRATEGY,
         )
         logger.info(
             "Rate limiting ENABLED with in-memory storage (single instance only)"
@@ -114,7 +134,7 @@ else:
                     key_func=get_user_id_or_ip,
                     default_limits=["1000/hour"],  # Default limit for all endpoints
                     storage_uri=REDIS_URL,
-                    strategy="fixed-window",
+                    strategy=RATE_LIMIT_STRATEGY,
                 )
                 logger.info(
                     f"Rate limiting ENABLED with Redis storage: {REDIS_URL.split('@')[-1] if '@' in REDIS_URL else REDIS_URL}"
@@ -135,7 +155,7 @@ else:
                 key_func=get_user_id_or_ip,
                 default_limits=["1000/hour"],
                 # No storage_uri = in-memory storage
-                strategy="fixed-window",
+                strategy=RATE_LIMIT_STRATEGY,
             )
             logger.info(
                 "Rate limiting ENABLED with in-memory storage (single instance only)"
@@ -39,6 +39,11 @@ REDIS_DB = int(parsed.path.lstrip("/")) if parsed.path else 0
 
 # Cache expiration times
 STATS_CACHE_TTL = 300
+# Shared tasks also change when the owner edits them, which doesn't invalidate
+# recipients' caches, so this TTL bounds how stale they can get
+SHARED_TASKS_CACHE_TTL = 60
+# Unfiltered task list pages; writes invalidate them, the TTL is a backstop
+TASK_LIST_CACHE_TTL = 60
 
 # Create Redis client
 try:
@@ -119,10 +124,49 @@ def delete_cache(key: str) -> bool:
         return False
 
 
-def invalidate_user_cache(user_id: int):
-    """Invalidate all cache entries for a user.
+def shared_tasks_cache_key(user_id: int) -> str:
+    """Cache key for the tasks shared with a user (GET /tasks/shared-with-me)"""
+    return f"shared_tasks:user_{user_id}"
+
+
+def _task_list_version_key(user_id: int) -> str:
+    return f"task_list_version:user_{user_id}"
+
+
+def task_list_cache_key(user_id: int, *params) -> Optional[str]:
+    """
+    Cache key for one unfiltered page of a user's task list (GET /tasks).
+    Embeds the user's list version, which invalidate_user_cache bumps, so all
+    cached pages go stale at once without scanning for keys.
+    Returns None if Redis is unavailable.
+    """
+    if not redis_client:
+        return None
+
+    try:
+        version = redis_client.get(_task_list_version_key(user_id)) or "0"
+    except Exception as e:
+        logger.error(f"Redis GET error: {e}")
+        return None
+
+    return ":".join([f"tasks:user_{user_id}:v{version}", *map(str, params)])
+
+
+def invalidate_user_cache(*user_ids: int):
+    """Invalidate all cache entries for one or more users.
     Called when user creates/updates/deletes tasks.
+    Every command is sent in a single pipelined round-trip.
     """
-    stats_key = f"stats:user_{user_id}"
-    delete_cache(stats_key)
-    logger.info(f"Invalidated cache for user_id={user_id}")
+    if not redis_client:
+        return
+
+    try:
+        with redis_client.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.delete(f"stats:user_{user_id}", shared_tasks_cache_key(user_id))
+                pipe.incr(_task_list_version_key(user_id))
+            pipe.execute()
+    except Exception as e:
+        logger.error(f"Redis invalidation error: {e}")
+        return
+    logger.info(f"Invalidated cache for user_ids={list(user_ids)}")
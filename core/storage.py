@@ -8,23 +8,38 @@ Switch between implementations using STORAGE_PROVIDER environment variable:
 This allows easy switching between implementations without code changes.
 """
 
+import logging
 import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
 
 # Storage provider selection
 STORAGE_PROVIDER = os.getenv("STORAGE_PROVIDER", "local").lower()
 
+# Chunk size used when streaming stored files back to clients
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class StorageInterface(ABC):
     """Abstract base class for storage implementations."""
 
     @abstractmethod
     def upload_file(
-        self, stored_filename: str, content: bytes, content_type: str
+        self,
+        stored_filename: str,
+        content: Union[bytes, BinaryIO],
+        content_type: str,
     ) -> None:
-        """Upload a file to storage."""
+        """
+        Upload a file to storage.
+        content may be raw bytes or a readable binary file object positioned
+        at the start; file objects are streamed rather than read into memory.
+        """
         pass
 
     @abstractmethod
@@ -32,19 +47,52 @@ class StorageInterface(ABC):
         """Download a file from storage. Returns file content as bytes."""
         pass
 
+    @abstractmethod
+    def stream_file(
+        self, stored_filename: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Stream a file from storage in chunks.
+        Raises FileNotFoundError up front (before any chunk is yielded).
+        """
+        pass
+
     @abstractmethod
     def delete_file(self, stored_filename: str) -> None:
         """Delete a file from storage."""
         pass
 
+    def delete_files(self, stored_filenames: list[str]) -> int:
+        """
+        Delete several files from storage. Returns how many were deleted.
+        Failures are logged and skipped. Backends override this when they
+        support batch deletes.
+        """
+        deleted = 0
+        for stored_filename in stored_filenames:
+            try:
+                self.delete_file(stored_filename)
+                deleted += 1
+            except Exception as e:
+                logger.warning(f"File deletion warning for {stored_filename}: {e}")
+        return deleted
+
     @abstractmethod
     def file_exists(self, stored_filename: str) -> bool:
         """Check if a file exists in storage."""
         pass
 
     @abstractmethod
-    def get_file_url(self, stored_filename: str) -> Optional[str]:
-        """Get a URL to access the file (if applicable). Returns None for local storage."""
+    def get_file_url(
+        self,
+        stored_filename: str,
+        download_filename: Optional[str] = None,
+        expires_in: int = 3600,
+    ) -> Optional[str]:
+        """
+        Get a URL to access the file (if applicable). Returns None for local storage.
+        download_filename, if given, is sent back as an attachment filename.
+        """
         pass
 
 
@@ -56,13 +104,30 @@ class LocalStorage(StorageInterface):
         self.upload_dir.mkdir(parents=True, exist_ok=True)
 
     def upload_file(
-        self, stored_filename: str, content: bytes, content_type: str
+        self,
+        stored_filename: str,
+        content: Union[bytes, BinaryIO],
+        content_type: str,
     ) -> None:
         """Save file to local filesystem."""
         file_path = self.upload_dir / stored_filename
         # Create parent directories if needed (e.g., for avatars/ subdirectory)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_bytes(content)
+
+        if isinstance(content, bytes):
+            file_path.write_bytes(content)
+            return
+
+        # Stream into a temp file beside the target, then swap it into place
+        # so a failed copy never leaves a partial file under the real name
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                shutil.copyfileobj(content, tmp_file)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     def download_file(self, stored_filename: str) -> bytes:
         """Read file from local filesystem."""
@@ -71,6 +136,21 @@ class LocalStorage(StorageInterface):
             raise FileNotFoundError(f"File not found: {stored_filename}")
         return file_path.read_bytes()
 
+    def stream_file(
+        self, stored_filename: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Stream file from local filesystem."""
+        file_path = self.upload_dir / stored_filename
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {stored_filename}")
+        return self._iter_file(file_path, chunk_size)
+
+    @staticmethod
+    def _iter_file(file_path: Path, chunk_size: int) -> Iterator[bytes]:
+        with open(file_path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
     def delete_file(self, stored_filename: str) -> None:
         """Delete file from local filesystem."""
         file_path = self.upload_dir / stored_filename
@@ -82,7 +162,12 @@ class LocalStorage(StorageInterface):
         file_path = self.upload_dir / stored_filename
         return file_path.exists()
 
-    def get_file_url(self, stored_filename: str) -> Optional[str]:
+    def get_file_url(
+        self,
+        stored_filename: str,
+        download_filename: Optional[str] = None,
+        expires_in: int = 3600,
+    ) -> Optional[str]:
         """Local storage doesn't provide URLs - files are served directly."""
         return None
 
@@ -96,6 +181,7 @@ class S3Storage(StorageInterface):
 
     def __init__(self):
         import boto3
+        from botocore.config import Config
 
         aws_region = os.getenv("AWS_REGION", "us-east-1")
         self.bucket_name = os.getenv("S3_BUCKET_NAME")
@@ -107,27 +193,51 @@ class S3Storage(StorageInterface):
                 "S3_BUCKET_NAME environment variable is required for S3 storage"
             )
 
+        # One client per process, shared by every request. Its HTTP pool
+        # defaults to 10 connections, which concurrent uploads/downloads in
+        # the threadpool would queue on; adaptive retries back off on throttling
         self.s3_client = boto3.client(
             "s3",
             region_name=aws_region,
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
+            config=Config(
+                max_pool_connections=50,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            ),
         )
 
     def upload_file(
-        self, stored_filename: str, content: bytes, content_type: str
+        self,
+        stored_filename: str,
+        content: Union[bytes, BinaryIO],
+        content_type: str,
     ) -> None:
         """Upload file to S3."""
+        from boto3.exceptions import S3UploadFailedError
         from botocore.exceptions import ClientError
 
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=stored_filename,
-                Body=content,
-                ContentType=content_type,
-            )
-        except ClientError as e:
+            if isinstance(content, bytes):
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=stored_filename,
+                    Body=content,
+                    ContentType=content_type,
+                )
+            else:
+                # Managed transfer reads the file object in parts; S3 verifies
+                # a SHA-256 checksum of what it received
+                self.s3_client.upload_fileobj(
+                    content,
+                    self.bucket_name,
+                    stored_filename,
+                    ExtraArgs={
+                        "ContentType": content_type,
+                        "ChecksumAlgorithm": "SHA256",
+                    },
+                )
+        except (ClientError, S3UploadFailedError) as e:
             raise RuntimeError(f"Failed to upload file to S3: {e}") from e
 
     def download_file(self, stored_filename: str) -> bytes:
@@ -146,6 +256,24 @@ class S3Storage(StorageInterface):
                 ) from e
             raise RuntimeError(f"Failed to download file from S3: {e}") from e
 
+    def stream_file(
+        self, stored_filename: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Stream file from S3 without reading the whole object into memory."""
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=stored_filename
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                raise FileNotFoundError(
+                    f"File not found in S3: {stored_filename}"
+                ) from e
+            raise RuntimeError(f"Failed to download file from S3: {e}") from e
+        return response["Body"].iter_chunks(chunk_size=chunk_size)
+
     def delete_file(self, stored_filename: str) -> None:
         """Delete file from S3."""
         from botocore.exceptions import ClientError
@@ -154,11 +282,34 @@ class S3Storage(StorageInterface):
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=stored_filename)
         except ClientError as e:
             # Log warning but don't fail - file might already be gone
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.warning(f"S3 deletion warning for {stored_filename}: {e}")
 
+    def delete_files(self, stored_filenames: list[str]) -> int:
+        """Delete files from S3 with batched DeleteObjects calls (1000 keys max each)."""
+        from botocore.exceptions import ClientError
+
+        deleted = 0
+        for start in range(0, len(stored_filenames), 1000):
+            batch = stored_filenames[start : start + 1000]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        "Objects": [{"Key": key} for key in batch],
+                        "Quiet": True,
+                    },
+                )
+            except ClientError as e:
+                logger.warning(f"S3 batch deletion warning: {e}")
+                continue
+            errors = response.get("Errors", [])
+            for error in errors:
+                logger.warning(
+                    f"S3 deletion warning for {error.get('Key')}: {error.get('Message')}"
+                )
+            deleted += len(batch) - len(errors)
+        return deleted
+
     def file_exists(self, stored_filename: str) -> bool:
         """Check if file exists in S3."""
         from botocore.exceptions import ClientError
@@ -169,13 +320,24 @@ class S3Storage(StorageInterface):
         except ClientError:
             return False
 
-    def get_file_url(self, stored_filename: str) -> Optional[str]:
+    def get_file_url(
+        self,
+        stored_filename: str,
+        download_filename: Optional[str] = None,
+        expires_in: int = 3600,
+    ) -> Optional[str]:
         """Generate a presigned URL for S3 file access."""
+        params = {"Bucket": self.bucket_name, "Key": stored_filename}
+        if download_filename:
+            safe_name = download_filename.replace('"', "")
+            params["ResponseContentDisposition"] = (
+                f'attachment; filename="{safe_name}"'
+            )
         try:
             url = self.s3_client.generate_presigned_url(
                 "get_object",
-                Params={"Bucket": self.bucket_name, "Key": stored_filename},
-                ExpiresIn=3600,  # 1 hour
+                Params=params,
+                ExpiresIn=expires_in,
             )
             return url
         except Exception:
@@ -1,3 +1,4 @@
+import hashlib
 import secrets
 from datetime import datetime, timedelta, timezone
 
@@ -12,6 +13,11 @@ def generate_token(expiration_hours: float) -> tuple[str, datetime]:
     return token_str, expires_at
 
 
+def hash_token(token_str: str) -> bytes:
+    """SHA-256 digest of a token, for storing and looking it up without the raw value"""
+    return hashlib.sha256(token_str.encode()).digest()
+
+
 def verify_token_expiration(
     expires_at: datetime, error_message: str = "Token has expired"
 ):
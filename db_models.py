@@ -9,10 +9,13 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     UniqueConstraint,
+    case,
 )
 from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.mutable import MutableList
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -29,7 +32,8 @@ class Task(Base):
     priority = Column(String(20), nullable=False)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     due_date = Column(Date, nullable=True)
-    tags = Column(ARRAY(String), default=list, nullable=False)
+    # MutableList tracks in-place append/remove, so no flag_modified is needed
+    tags = Column(MutableList.as_mutable(ARRAY(String)), default=list, nullable=False)
     notes = Column(String(500), nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
@@ -45,6 +49,37 @@ class Task(Base):
         "TaskShare", back_populates="task", cascade="all, delete-orphan"
     )
 
+    # Every task list query filters by owner first, so the composite indexes
+    # lead with user_id and follow with the filter/sort column
+    __table_args__ = (
+        # Default (id) and created_at orders end on id, matching the keyset
+        # cursor, so each page is one index range scan with no sort
+        Index("ix_tasks_user_id", "user_id", "id"),
+        Index("ix_tasks_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_tasks_user_due_id", "user_id", "due_date", "id"),
+        Index("ix_tasks_user_completed_due", "user_id", "completed", "due_date"),
+        Index("ix_tasks_user_priority", "user_id", "priority"),
+        # Array containment (tags @> ARRAY[...]) for the tags filter
+        Index("ix_tasks_tags_gin", "tags", postgresql_using="gin"),
+        # Trigram indexes so the ILIKE '%term%' search can use an index (pg_trgm).
+        # Search matches title OR description, so both need one for a BitmapOr
+        Index(
+            "ix_tasks_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_tasks_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
+
+    # Fetch server-generated created_at via RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
     @property
     def share_count(self):
         """Count how many users this task is shared with"""
@@ -54,6 +89,14 @@ class Task(Base):
         return f"<Task(id={self.id}, title={self.title[:30]}, user={self.user_id}, completed={self.completed})>"
 
 
+# Priorities sort by rank (low < medium < high), not alphabetically. The
+# expression index lets sort_by=priority and its cursor pages read in order;
+# queries must use PRIORITY_RANK as-is for the planner to match it
+PRIORITY_ORDER = {"low": 0, "medium": 1, "high": 2}
+PRIORITY_RANK = case(PRIORITY_ORDER, value=Task.priority)
+Index("ix_tasks_user_priority_rank", Task.user_id, PRIORITY_RANK, Task.id)
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -64,7 +107,7 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     avatar_url = Column(String, nullable=True)
     email_verified = Column(Boolean, default=False)
-    verification_code = Column(String, nullable=True)
+    verification_code = Column(LargeBinary(32), nullable=True)  # sha256 of the token
     verification_expires = Column(DateTime(timezone=True), nullable=True)
     password_reset_token = Column(String, nullable=True)
     password_reset_token_expires = Column(DateTime(timezone=True), nullable=True)
@@ -82,6 +125,17 @@ class User(Base):
         "ActivityLog", back_populates="user", cascade="all, delete-orphan"
     )
 
+    # Verification links are looked up by token hash (equality only, so a hash
+    # index); only pending tokens are indexed
+    __table_args__ = (
+        Index(
+            "ix_users_verification_code",
+            "verification_code",
+            postgresql_using="hash",
+            postgresql_where=verification_code.isnot(None),
+        ),
+    )
+
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username}, email={self.email})>"
 
@@ -96,6 +150,7 @@ class TaskFile(Base):
     stored_filename = Column(String(255), nullable=False, unique=True)
     file_size = Column(Integer, nullable=False)
     content_type = Column(String(100))
+    sha256 = Column(String(64), nullable=True)  # hex digest, computed on upload
     uploaded_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
@@ -116,6 +171,14 @@ class TaskComment(Base):
     task = relationship("Task", back_populates="comments")
     user = relationship("User", back_populates="comments")
 
+    # Comment threads are always read by task in chronological order
+    __table_args__ = (
+        Index("ix_comments_task_created", "task_id", "created_at"),
+    )
+
+    # Fetch server-generated timestamps via RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
 
 class TaskShare(Base):
     __tablename__ = "task_shares"
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional, Sequence
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -34,6 +34,15 @@ class TaskPermission(Enum):
     OWNER = "owner"
 
 
+# Define permission hierarchy
+PERMISSION_LEVELS = {
+    TaskPermission.NONE: 0,
+    TaskPermission.VIEW: 1,
+    TaskPermission.EDIT: 2,
+    TaskPermission.OWNER: 3,
+}
+
+
 # This tells FastAPI to look for "Authorization: Bearer <token>" header
 security = HTTPBearerAuth()
 
@@ -101,27 +110,51 @@ def get_user_task_permission(
         VIEW - Task is shared with user with view permission
         NONE - User has no access
     """
+    return get_user_task_permission_by_id(
+        task.id, task.user_id, user, db_session  # type: ignore
+    )
+
+
+def _permission_from_share(
+    owner_id: int, user_id: int, share_permission: str | None
+) -> TaskPermission:
+    """
+    Map a task's owner and the user's share permission (None if the task
+    isn't shared with them) to a TaskPermission.
+    """
+    if owner_id == user_id:
+        return TaskPermission.OWNER
+    if share_permission is None:
+        return TaskPermission.NONE
+    if share_permission == "edit":
+        return TaskPermission.EDIT
+    return TaskPermission.VIEW
+
+
+def get_user_task_permission_by_id(
+    task_id: int, owner_id: int, user: db_models.User, db_session: Session
+) -> TaskPermission:
+    """
+    Same as get_user_task_permission, for callers that only selected the
+    task's id and owner rather than loading the Task.
+    """
     # Owner has full access
-    if task.user_id == user.id:  # type: ignore
+    if owner_id == user.id:  # type: ignore
         return TaskPermission.OWNER
 
     # Check if task is shared with this user
     share = (
-        db_session.query(db_models.TaskShare)
+        db_session.query(db_models.TaskShare.permission)
         .filter(
-            db_models.TaskShare.task_id == task.id,
+            db_models.TaskShare.task_id == task_id,
             db_models.TaskShare.shared_with_user_id == user.id,
         )
         .first()
     )
 
-    if not share:
-        return TaskPermission.NONE
-
-    if share.permission == "edit":  # type: ignore
-        return TaskPermission.EDIT
-    else:
-        return TaskPermission.VIEW
+    return _permission_from_share(
+        owner_id, user.id, share.permission if share else None  # type: ignore
+    )
 
 
 def require_task_access(
@@ -136,18 +169,71 @@ def require_task_access(
     Usage:
         require_task_access(task, current_user, db_session, TaskPermission.EDIT)
     """
-    user_permission = get_user_task_permission(task, user, db_session)
+    require_task_access_by_id(
+        task.id, task.user_id, user, db_session, min_permission  # type: ignore
+    )
+
+
+def require_task_access_by_id(
+    task_id: int,
+    owner_id: int,
+    user: db_models.User,
+    db_session: Session,
+    min_permission: TaskPermission = TaskPermission.VIEW,
+):
+    """
+    require_task_access for callers holding only the task's id and owner id.
 
-    # Define permission hierarchy
-    permission_levels = {
-        TaskPermission.NONE: 0,
-        TaskPermission.VIEW: 1,
-        TaskPermission.EDIT: 2,
-        TaskPermission.OWNER: 3,
-    }
+    Usage:
+        require_task_access_by_id(row.task_id, row.owner_id, current_user, db_session)
+    """
+    user_permission = get_user_task_permission_by_id(
+        task_id, owner_id, user, db_session
+    )
 
-    if permission_levels[user_permission] < permission_levels[min_permission]:
+    if PERMISSION_LEVELS[user_permission] < PERMISSION_LEVELS[min_permission]:
         raise UnauthorizedTaskAccessError(
-            task_id=task.id,  # type: ignore
+            task_id=task_id,
             user_id=user.id,  # type: ignore
         )
+
+
+def batch_require_task_access(
+    tasks: Sequence[Any],
+    user: db_models.User,
+    db_session: Session,
+    min_permission: TaskPermission = TaskPermission.VIEW,
+):
+    """
+    require_task_access for many tasks, with one share lookup for all of them.
+    Each task only needs .id and .user_id, so Task objects and (id, user_id)
+    rows both work. Raises for the first task the user can't access.
+
+    Usage:
+        batch_require_task_access(rows, current_user, db_session, TaskPermission.EDIT)
+    """
+    # Owned tasks need no lookup; the rest are checked against one query
+    shared_ids = [task.id for task in tasks if task.user_id != user.id]
+    share_permissions = {}
+    if shared_ids:
+        share_permissions = dict(
+            db_session.query(
+                db_models.TaskShare.task_id, db_models.TaskShare.permission
+            )
+            .filter(
+                db_models.TaskShare.task_id.in_(shared_ids),
+                db_models.TaskShare.shared_with_user_id == user.id,
+            )
+            .all()
+        )
+
+    for task in tasks:
+        user_permission = _permission_from_share(
+            task.user_id, user.id, share_permissions.get(task.id)  # type: ignore
+        )
+
+        if PERMISSION_LEVELS[user_permission] < PERMISSION_LEVELS[min_permission]:
+            raise UnauthorizedTaskAccessError(
+                task_id=task.id,
+                user_id=user.id,  # type: ignore
+            )
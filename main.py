@@ -103,6 +103,35 @@ app = FastAPI(
     swagger_ui_parameters={"persistAuthorization": True},
 )
 
+
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    """
+    Reject file uploads whose declared Content-Length is over the limit.
+    Runs before FastAPI parses the multipart body, so an oversized upload is
+    refused without being received. Registered before CORS so the 413 still
+    carries CORS headers.
+    """
+    if request.method == "POST" and request.url.path.endswith("/files"):
+        content_length = request.headers.get("content-length", "")
+        if (
+            content_length.isdigit()
+            and int(content_length) > files.MAX_UPLOAD_REQUEST_SIZE
+        ):
+            logger.warning(
+                "Upload rejected: Content-Length %s exceeds limit (path: %s)",
+                content_length,
+                request.url.path,
+            )
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={
+                    "detail": f"File too large. Max size: {files.MAX_FILE_SIZE / 1024 / 1024} MB"
+                },
+            )
+    return await call_next(request)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -2,11 +2,12 @@ import logging
 import os
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from slowapi.util import get_remote_address
 from sqlalchemy.orm import Session
 
 import db_models
 from core import exceptions
-from core.rate_limit_config import limiter
+from core.rate_limit_config import get_ip_and_username, limiter
 from core.security import create_access_token, hash_password, verify_password
 from core.tokens import generate_token, verify_token_expiration
 from db_config import get_db
@@ -44,7 +45,9 @@ def register_user(
     """
 
     logger.info(
-        f"Registration attempt for username: {user_data.username}, email: {user_data.email}"
+        "Registration attempt for username: %s, email: %s",
+        user_data.username,
+        user_data.email,
     )
 
     # Check if username already exists
@@ -55,7 +58,7 @@ def register_user(
     )
     if existing_user:
         logger.warning(
-            f"Registration failed: username '{user_data.username}' already exists"
+            "Registration failed: username '%s' already exists", user_data.username
         )
         raise exceptions.DuplicateUserError(field="username", value=user_data.username)
 
@@ -66,7 +69,9 @@ def register_user(
         .first()
     )
     if existing_email:
-        logger.warning(f"Registration failed: email '{user_data.email}' already exists")
+        logger.warning(
+            "Registration failed: email '%s' already exists", user_data.email
+        )
         raise exceptions.DuplicateUserError(field="email", value=user_data.email)
 
     # Hash the password
@@ -84,17 +89,28 @@ def register_user(
     db_session.refresh(new_user)
 
     logger.info(
-        f"User registered successfully: username='{new_user.username}', user_id={new_user.id}"
+        "User registered successfully: username='%s', user_id=%s",
+        new_user.username,
+        new_user.id,
     )
 
     return new_user
 
 
+def _login_body(request: Request, login_data: UserLogin) -> UserLogin:
+    """Expose the attempted username to the login rate limit key"""
+    request.state.login_username = login_data.username
+    return login_data
+
+
 @router.post("/login", response_model=Token)
-@limiter.limit("5/minute")  # Only 5 login attempts per minute
+# 5 attempts per minute per (IP, username) pair, capped at 20 per minute per IP
+# so one source can't spray passwords across many usernames
+@limiter.limit("20/minute", key_func=get_remote_address)
+@limiter.limit("5/minute", key_func=get_ip_and_username)
 def login_user(
     request: Request,  # pylint: disable=unused-argument
-    login_data: UserLogin,
+    login_data: UserLogin = Depends(_login_body),
     db_session: Session = Depends(get_db),
 ):
     """
@@ -102,11 +118,11 @@ def login_user(
     - Validates credentials
     - Returns JWT access token
     - Token must be included in Authorization header for protected routes
-    - Rate limited to 5 attempts per minute
+    - Rate limited to 5 attempts per minute per username, 20 per minute per IP
     """
 
     logger.info(
-        f"Login attempt for username: {login_data.username} (rate limit: 5/minute)"
+        "Login attempt for username: %s (rate limit: 5/minute)", login_data.username
     )
 
     # Look up user by username
@@ -119,14 +135,14 @@ def login_user(
     # Check if user exists and if password is correct
     if not user or not verify_password(login_data.password, user.hashed_password):  # type: ignore
         logger.warning(
-            f"Login failed for username: {login_data.username} (invalid credentials)"
+            "Login failed for username: %s (invalid credentials)", login_data.username
         )
         raise exceptions.InvalidCredentialsError()
 
     # Create access token
     access_token = create_access_token(data={"sub": user.username})
 
-    logger.info(f"Login successful for user: {user.username} (user_id={user.id})")
+    logger.info("Login successful for user: %s (user_id=%s)", user.username, user.id)
 
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -154,7 +170,7 @@ def request_password_reset(
     if not user:
         return {"message": "If email exists, password reset sent."}
 
-    logger.info(f"Password reset requested for user_id={user.id}")
+    logger.info("Password reset requested for user_id=%s", user.id)
 
     token_str, expires_at = generate_token(expiration_hours=0.5)
     user.password_reset_token = token_str  # type: ignore
@@ -211,10 +227,10 @@ FAROS Task Manager
     )
 
     if not success:
-        logger.error(f"Failed to send password reset email to user_id={user.id}")
+        logger.error("Failed to send password reset email to user_id=%s", user.id)
         return {"message": "If email exists, password reset sent"}
 
-    logger.info(f"Password reset email sent successfully to user_id={user.id}")
+    logger.info("Password reset email sent successfully to user_id=%s", user.id)
     return {"message": "If email exists, password reset sent"}
 
 
@@ -243,7 +259,7 @@ def verify_password_reset(
         error_message="Password reset link has expired. Please request a new one.",
     )
 
-    logger.info(f"Password reset successful for user_id={user.id}")
+    logger.info("Password reset successful for user_id=%s", user.id)
 
     user.hashed_password = hash_password(request.new_password)  # type: ignore
     user.password_reset_token = None  # type: ignore
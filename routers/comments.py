@@ -29,12 +29,20 @@ def add_comment(
     current_user: db_models.User = Depends(get_current_user),
 ):
     """Add comments to a task"""
-    logger.info(f"Adding comments for task_id={task_id} for user_id={current_user.id}")
+    logger.info(
+        "Adding comments for task_id=%s for user_id=%s", task_id, current_user.id
+    )
 
-    task = db_session.query(db_models.Task).filter(db_models.Task.id == task_id).first()
+    # Owner is joined in so the notification below needs no extra lookup
+    task = (
+        db_session.query(db_models.Task)
+        .options(joinedload(db_models.Task.owner))
+        .filter(db_models.Task.id == task_id)
+        .first()
+    )
 
     if not task:
-        logger.warning(f"Task not found: task_id={task_id}")
+        logger.warning("Task not found: task_id=%s", task_id)
         raise exceptions.TaskNotFoundError(task_id=task_id)
 
     require_task_access(task, current_user, db_session, TaskPermission.VIEW)
@@ -43,15 +51,15 @@ def add_comment(
         task_id=task_id, user_id=current_user.id, content=comment_data.content
     )
 
+    # One flush assigns comment.id; the activity row is written with the commit
     db_session.add(comment)
     db_session.flush()
 
     activity_service.log_comment_created(
         db_session=db_session, user_id=current_user.id, comment=comment  # type: ignore
     )
-    db_session.commit()
-    db_session.refresh(comment)
 
+    # Read notification fields before commit expires the task
     if task.user_id != current_user.id:  # type:ignore
         background_tasks.add_task(
             notify_comment_added,
@@ -62,10 +70,9 @@ def add_comment(
             comment_content=comment_data.content,
         )
 
-    invalidate_user_cache(current_user.id)  # type: ignore
-
-    logger.info(f"Successfully added comment_id={comment.id} for task_id={task_id}")
-    return {
+    # created_at came back with the INSERT (eager_defaults); build the
+    # response now so commit's expiry doesn't force a reload
+    response = {
         "id": comment.id,
         "task_id": comment.task_id,
         "user_id": comment.user_id,
@@ -74,6 +81,17 @@ def add_comment(
         "updated_at": comment.updated_at,
         "username": current_user.username,
     }
+    owner_id = task.user_id
+
+    db_session.commit()
+
+    # The owner's cached task list embeds the task's comments
+    invalidate_user_cache(*{current_user.id, owner_id})  # type: ignore
+
+    logger.info(
+        "Successfully added comment_id=%s for task_id=%s", response["id"], task_id
+    )
+    return response
 
 
 @task_comments_router.get("/{task_id}/comments", response_model=list[Comment])
@@ -83,7 +101,7 @@ def get_comments(
     current_user: db_models.User = Depends(get_current_user),
 ):
     """List all comments attached to a task"""
-    logger.info(f"Listing comments for task_id={task_id}, user_id={current_user.id}")
+    logger.info("Listing comments for task_id=%s, user_id=%s", task_id, current_user.id)
 
     # Check if task exists and user owns it
     task = db_session.query(db_models.Task).filter(db_models.Task.id == task_id).first()
@@ -93,27 +111,25 @@ def get_comments(
 
     require_task_access(task, current_user, db_session, TaskPermission.VIEW)
 
-    comments = (
-        db_session.query(db_models.TaskComment)
-        .options(joinedload(db_models.TaskComment.user))
+    # Project only the columns the response needs; no User objects are built
+    rows = (
+        db_session.query(
+            db_models.TaskComment.id,
+            db_models.TaskComment.task_id,
+            db_models.TaskComment.user_id,
+            db_models.TaskComment.content,
+            db_models.TaskComment.created_at,
+            db_models.TaskComment.updated_at,
+            db_models.User.username,
+        )
+        .join(db_models.User, db_models.TaskComment.user_id == db_models.User.id)
         .filter(db_models.TaskComment.task_id == task_id)
         .order_by(db_models.TaskComment.created_at)
         .all()
     )
 
-    logger.info(f"Found {len(comments)} comments for task_id={task_id}")
-    return [
-        {
-            "id": c.id,
-            "task_id": c.task_id,
-            "user_id": c.user_id,
-            "content": c.content,
-            "created_at": c.created_at,
-            "updated_at": c.updated_at,
-            "username": c.user.username if c.user else None,
-        }
-        for c in comments
-    ]
+    logger.info("Found %s comments for task_id=%s", len(rows), task_id)
+    return [row._asdict() for row in rows]
 
 
 @comments_router.patch("/{comment_id}", response_model=Comment)
@@ -124,17 +140,18 @@ def update_comment(
     current_user: db_models.User = Depends(get_current_user),
 ):
     """Edit a comment"""
-    logger.info(f"Updating comment={comment_id} for user_id={current_user.id}")
+    logger.info("Updating comment=%s for user_id=%s", comment_id, current_user.id)
 
-    # Find the task
+    # Comment and its task in one round-trip for the permission check
     comment = (
         db_session.query(db_models.TaskComment)
+        .options(joinedload(db_models.TaskComment.task))
         .filter(db_models.TaskComment.id == comment_id)
         .first()
     )
 
     if not comment:
-        logger.warning(f"Comment not found: comment_id={comment_id}")
+        logger.warning("Comment not found: comment_id=%s", comment_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
         )
@@ -144,8 +161,11 @@ def update_comment(
     # Check if task belongs to current user
     if comment.user_id != current_user.id:  # type: ignore
         logger.warning(
-            f"Unauthorized access attempt: user_id={current_user.id} "
-            f"tried to access comment_id={comment_id} owned by user_id={comment.user_id}"
+            "Unauthorized access attempt: user_id=%s "
+            "tried to access comment_id=%s owned by user_id=%s",
+            current_user.id,
+            comment_id,
+            comment.user_id,
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -166,22 +186,32 @@ def update_comment(
         new_content=new_content,  # type: ignore
     )
 
-    db_session.commit()
-    db_session.refresh(comment)
-
-    logger.info(
-        f"Comment updated successfully: comment_id={comment_id}, user_id={current_user.id}"
-    )
+    # The UPDATE returns the new updated_at (eager_defaults)
+    db_session.flush()
 
-    return {
+    # Only the author can edit, so the username is the current user's
+    response = {
         "id": comment.id,
         "task_id": comment.task_id,
         "user_id": comment.user_id,
         "content": comment.content,
         "created_at": comment.created_at,
         "updated_at": comment.updated_at,
-        "username": comment.user.username if comment.user else None,
+        "username": current_user.username,
     }
+    owner_id = comment.task.user_id
+
+    db_session.commit()
+
+    invalidate_user_cache(owner_id)  # type: ignore
+
+    logger.info(
+        "Comment updated successfully: comment_id=%s, user_id=%s",
+        comment_id,
+        current_user.id,
+    )
+
+    return response
 
 
 @comments_router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -191,17 +221,18 @@ def delete_comment(
     current_user: db_models.User = Depends(get_current_user),
 ):
     """Delete a comment"""
-    logger.info(f"Deleting comment={comment_id} for user_id={current_user.id}")
+    logger.info("Deleting comment=%s for user_id=%s", comment_id, current_user.id)
 
-    # Find the task
+    # Comment and its task in one round-trip for the permission check
     comment = (
         db_session.query(db_models.TaskComment)
+        .options(joinedload(db_models.TaskComment.task))
         .filter(db_models.TaskComment.id == comment_id)
         .first()
     )
 
     if not comment:
-        logger.warning(f"Comment not found: comment_id={comment_id}")
+        logger.warning("Comment not found: comment_id=%s", comment_id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
         )
@@ -211,8 +242,11 @@ def delete_comment(
     # Check if task belongs to current user
     if current_user.id not in (comment.user_id, comment.task.user_id):  # type: ignore
         logger.warning(
-            f"Unauthorized access attempt: user_id={current_user.id} "
-            f"tried to access comment_id={comment_id} owned by user_id={comment.user_id}"
+            "Unauthorized access attempt: user_id=%s "
+            "tried to access comment_id=%s owned by user_id=%s",
+            current_user.id,
+            comment_id,
+            comment.user_id,
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -223,9 +257,10 @@ def delete_comment(
     activity_service.log_comment_deleted(
         db_session=db_session, user_id=current_user.id, comment=comment  # type: ignore
     )
+    owner_id = comment.task.user_id
     db_session.delete(comment)
     db_session.commit()
 
-    invalidate_user_cache(current_user.id)  # type: ignore
+    invalidate_user_cache(*{current_user.id, owner_id})  # type: ignore
 
-    logger.info(f"Comment deleted successfully: comment_id={comment_id}")
+    logger.info("Comment deleted successfully: comment_id=%s", comment_id)
@@ -1,20 +1,39 @@
+import hashlib
 import logging
 import os
-import uuid
+import secrets
+import zlib
 from pathlib import Path
-
-from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
-from fastapi.responses import FileResponse, StreamingResponse
+from typing import Iterable, Iterator
+from urllib.parse import quote
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 import db_models
 from core import exceptions
 from core.rate_limit_config import limiter
-from core.storage import get_file_path, storage
+from core.storage import LocalStorage, get_file_path, storage
 from db_config import get_db
-from dependencies import TaskPermission, get_current_user, require_task_access
+from dependencies import (
+    TaskPermission,
+    get_current_user,
+    require_task_access,
+    require_task_access_by_id,
+)
 from schemas.file import FileUploadResponse, TaskFileInfo
 from services import activity_service
+from services.background_tasks import delete_stored_files
 
 # Router for task-related file endpoints
 task_files_router = APIRouter(prefix="/tasks", tags=["files"])
@@ -25,14 +44,79 @@ files_router = APIRouter(prefix="/files", tags=["files"])
 # File size limit (10 MB)
 MAX_FILE_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", "10485760"))
 
+# Largest request body accepted for an upload: the file plus multipart framing.
+# Checked against Content-Length before the body is read (see main.py)
+MAX_UPLOAD_REQUEST_SIZE = MAX_FILE_SIZE + 64 * 1024
+
+# Uploads are read in chunks of this size so memory use doesn't grow with the file
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# Lifetime of presigned S3 download links handed out by download_file
+DOWNLOAD_URL_EXPIRES_IN = 300
+
+# Content types worth gzipping when served from local storage. Images, PDFs and
+# .docx (a zip archive) are already compressed, so they go out as-is
+COMPRESSIBLE_CONTENT_TYPES = frozenset({"application/msword"})
+
 # Allowed file types
 ALLOWED_EXTENSIONS_STR = os.getenv(
     "ALLOWED_EXTENSIONS", ".jpg,.jpeg,.png,.gif,.pdf,.txt,.doc,.docx"
 )
-ALLOWED_EXTENSIONS = set(ext.strip() for ext in ALLOWED_EXTENSIONS_STR.split(","))
+ALLOWED_EXTENSIONS = frozenset(
+    ext.strip().lower() for ext in ALLOWED_EXTENSIONS_STR.split(",")
+)
+# Rendered once for the "type not allowed" error message
+_ALLOWED_TYPES_STR = ", ".join(sorted(ALLOWED_EXTENSIONS))
 
 logger = logging.getLogger(__name__)
 
+
+def _file_extension(filename: str | None) -> str:
+    """Lower-cased extension including the dot (".pdf"), or "" if there is none"""
+    if not filename:
+        return ""
+    dot = filename.rfind(".")
+    return filename[dot:].lower() if dot >= 0 else ""
+
+
+def _is_compressible(content_type: str | None) -> bool:
+    """Whether a stored file of this type shrinks meaningfully under gzip"""
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_CONTENT_TYPES
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """Whether the client listed gzip in Accept-Encoding (without q=0)"""
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip a stream of chunks as they arrive, without buffering the whole file"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31 = gzip framing
+    for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
+
+
+def _content_disposition(filename: str) -> str:
+    """Attachment header for a stored file, encoded the way FileResponse does it"""
+    quoted = quote(filename)
+    if quoted == filename:
+        return f'attachment; filename="{filename}"'
+    # RFC 5987 form for non-ASCII or quote-breaking names, with a plain-ASCII
+    # fallback for clients that ignore filename*
+    fallback = filename.encode("ascii", "ignore").decode()
+    fallback = fallback.replace('"', "").replace("\\", "")
+    return f"attachment; filename=\"{fallback}\"; filename*=utf-8''{quoted}"
+
+
 # Upload directory
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
@@ -44,7 +128,7 @@ UPLOAD_DIR.mkdir(exist_ok=True)
     status_code=status.HTTP_201_CREATED,
 )
 @limiter.limit("20/hour")  # 20 file uploads per hour
-async def upload_file(
+def upload_file(
     request: Request,  # pylint: disable=unused-argument
     task_id: int,
     file: UploadFile = File(...),
@@ -55,54 +139,62 @@ async def upload_file(
     Upload a file and attach it to a task.
     - Max file size: 10 MB
     - Allowed types: images, PDFs, documents
+
+    Plain def so FastAPI runs it in the threadpool: the storage write and DB
+    calls block, and must not stall the event loop. The multipart body is
+    already spooled by the time this runs, so file.file is read directly.
     """
     logger.info(
         f"File upload attempt for task_id={task_id} \
         by user_id={current_user.id}: filename={file.filename}"
     )
 
-    # Check if task exists and verify access permissions
-    task = db_session.query(db_models.Task).filter(db_models.Task.id == task_id).first()
-
-    if not task:
-        logger.warning(f"Upload failed: task_id={task_id} not found")
-        raise exceptions.TaskNotFoundError(task_id=task_id)
-
-    require_task_access(task, current_user, db_session, TaskPermission.EDIT)
-
-    # Validate file extension
-    file_ext = Path(file.filename).suffix.lower()  # type: ignore
-    allowed_types = (", ".join(ALLOWED_EXTENSIONS),)
+    # Validate file extension first - rejecting costs no DB work
+    file_ext = _file_extension(file.filename)
     if file_ext not in ALLOWED_EXTENSIONS:
         logger.warning(f"Upload failed: invalid file type {file_ext}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
-                f"File type {file_ext} not allowed. Allowed types: {allowed_types}"
+                f"File type {file_ext} not allowed. Allowed types: {_ALLOWED_TYPES_STR}"
             ),
         )
 
-    # Read file content
-    content = await file.read()
-    file_size = len(content)
+    # Check if task exists and verify access permissions
+    task = db_session.query(db_models.Task).filter(db_models.Task.id == task_id).first()
 
-    # Validate file size
-    if file_size > MAX_FILE_SIZE:
-        logger.warning(f"Upload failed: file too large ({file_size} bytes)")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Max size: {MAX_FILE_SIZE / 1024 / 1024} MB",
-        )
+    if not task:
+        logger.warning(f"Upload failed: task_id={task_id} not found")
+        raise exceptions.TaskNotFoundError(task_id=task_id)
+
+    require_task_access(task, current_user, db_session, TaskPermission.EDIT)
+
+    # Measure and hash the upload chunk by chunk in a single pass,
+    # bailing out as soon as it's too large
+    file_size = 0
+    digest = hashlib.sha256()
+    while chunk := file.file.read(UPLOAD_CHUNK_SIZE):
+        file_size += len(chunk)
+        if file_size > MAX_FILE_SIZE:
+            logger.warning(f"Upload failed: file too large (>{MAX_FILE_SIZE} bytes)")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File too large. Max size: {MAX_FILE_SIZE / 1024 / 1024} MB",
+            )
+        digest.update(chunk)
+    file.file.seek(0)
 
     # Generate unique filename
-    unique_id = str(uuid.uuid4())
-    stored_filename = f"task_{task_id}_{unique_id}{file_ext}"
+    # Random hex leads the key so S3 spreads objects across prefixes and local
+    # storage fans out over 256x256 directories: "ab/cd/abcd..._{task_id}.pdf"
+    unique_id = secrets.token_hex(16)
+    stored_filename = f"{unique_id[:2]}/{unique_id[2:4]}/{unique_id}_{task_id}{file_ext}"
 
     # Save file using storage abstraction (works with both local and S3)
     try:
         storage.upload_file(
             stored_filename=stored_filename,
-            content=content,
+            content=file.file,
             content_type=file.content_type or "application/octet-stream",
         )
         logger.info(f"File saved: {stored_filename} ({file_size} bytes)")
@@ -120,6 +212,7 @@ async def upload_file(
         stored_filename=stored_filename,
         file_size=file_size,
         content_type=file.content_type,
+        sha256=digest.hexdigest(),
     )
 
     db_session.add(task_file)
@@ -129,15 +222,19 @@ async def upload_file(
         db_session=db_session, user_id=current_user.id, task_file=task_file  # type: ignore
     )
 
+    # Every response field is already set after the flush (id via RETURNING,
+    # uploaded_at from the Python-side default); build the response before
+    # commit expires the object so no reload SELECT is needed
+    response = FileUploadResponse.model_validate(task_file)
+
     db_session.commit()
-    db_session.refresh(task_file)
 
     logger.info(
-        f"File uploaded successfully: file_id={task_file.id}, "
+        f"File uploaded successfully: file_id={response.id}, "
         f"task_id={task_id}, user_id={current_user.id}"
     )
 
-    return task_file
+    return response
 
 
 @task_files_router.get("/{task_id}/files", response_model=list[TaskFileInfo])
@@ -157,29 +254,52 @@ def list_task_files(
 
     require_task_access(task, current_user, db_session, TaskPermission.VIEW)
 
-    # Use the relationship
-    files = task.files
+    # Project just the response columns instead of hydrating TaskFile objects
+    rows = (
+        db_session.query(
+            db_models.TaskFile.id,
+            db_models.TaskFile.original_filename,
+            db_models.TaskFile.file_size,
+            db_models.TaskFile.content_type,
+            db_models.TaskFile.sha256,
+            db_models.TaskFile.uploaded_at,
+        )
+        .filter(db_models.TaskFile.task_id == task_id)
+        .all()
+    )
 
-    logger.info(f"Found {len(files)} files for task_id={task_id}")
+    logger.info(f"Found {len(rows)} files for task_id={task_id}")
 
-    return files
+    return [row._asdict() for row in rows]
 
 
 @files_router.get("/{file_id}")
-async def download_file(
+def download_file(
     file_id: int,
+    request: Request,
     db_session: Session = Depends(get_db),
     current_user: db_models.User = Depends(get_current_user),
 ):
     """
     Download a file by its ID.
-    Returns the actual file for download
+    Returns the actual file for download.
+
+    Locally stored text files are gzipped for clients that accept it.
     """
     logger.info(f"File download request: file_id={file_id}, user_id={current_user.id}")
 
-    # Get the file record
+    # Select only the file columns used here plus the task owner for the
+    # permission check, rather than loading TaskFile and Task objects
     task_file = (
-        db_session.query(db_models.TaskFile)
+        db_session.query(
+            db_models.TaskFile.id,
+            db_models.TaskFile.task_id,
+            db_models.TaskFile.stored_filename,
+            db_models.TaskFile.original_filename,
+            db_models.TaskFile.content_type,
+            db_models.Task.user_id.label("owner_id"),
+        )
+        .join(db_models.Task, db_models.Task.id == db_models.TaskFile.task_id)
         .filter(db_models.TaskFile.id == file_id)
         .first()
     )
@@ -191,39 +311,73 @@ async def download_file(
             detail=f"File with ID {file_id} not found",
         )
     # Verify user has permission to access the parent task
-    require_task_access(task_file.task, current_user, db_session, TaskPermission.VIEW)
+    require_task_access_by_id(
+        task_file.task_id,
+        task_file.owner_id,
+        current_user,
+        db_session,
+        TaskPermission.VIEW,
+    )
 
-    # Download file using storage abstraction
+    # Local files go out via FileResponse. S3 downloads redirect to a short-lived
+    # presigned URL so the bytes never pass through the API; if no URL can be
+    # generated, the object is streamed through instead
     try:
-        file_content = storage.download_file(task_file.stored_filename)  # type: ignore
-
-        logger.info(
-            f"File download successful: file_id={file_id}, filename={task_file.original_filename}"
-        )
-
-        # For local storage, use FileResponse for efficiency
-        # For S3, use StreamingResponse with BytesIO
-        from io import BytesIO
-
-        from core.storage import LocalStorage
-
         if isinstance(storage, LocalStorage):
             file_path = storage.get_file_path(task_file.stored_filename)  # type: ignore
-            return FileResponse(
-                path=str(file_path),
-                media_type=task_file.content_type or "application/octet-stream",  # type: ignore
-                filename=task_file.original_filename,  # type: ignore
+            if not file_path.exists():
+                raise FileNotFoundError(task_file.stored_filename)
+            media_type = task_file.content_type or "application/octet-stream"
+            compressible = _is_compressible(task_file.content_type)  # type: ignore
+            # Text is gzipped on the way out for clients that accept it. Range
+            # requests get the identity bytes so resumed downloads still work
+            if (
+                compressible
+                and _accepts_gzip(request)
+                and "range" not in request.headers
+            ):
+                chunks = storage.stream_file(task_file.stored_filename)  # type: ignore
+                response = StreamingResponse(
+                    _gzip_chunks(chunks),
+                    media_type=media_type,  # type: ignore
+                    headers={
+                        "Content-Disposition": _content_disposition(
+                            task_file.original_filename  # type: ignore
+                        ),
+                        "Content-Encoding": "gzip",
+                        "Vary": "Accept-Encoding",
+                    },
+                )
+            else:
+                response = FileResponse(
+                    path=str(file_path),
+                    media_type=media_type,  # type: ignore
+                    filename=task_file.original_filename,  # type: ignore
+                    headers={"Vary": "Accept-Encoding"} if compressible else None,
+                )
+        elif url := storage.get_file_url(
+            task_file.stored_filename,  # type: ignore
+            download_filename=task_file.original_filename,  # type: ignore
+            expires_in=DOWNLOAD_URL_EXPIRES_IN,
+        ):
+            response = RedirectResponse(
+                url=url, status_code=status.HTTP_307_TEMPORARY_REDIRECT
             )
         else:
-            # S3 storage - stream the bytes
-            file_stream = BytesIO(file_content)
-            return StreamingResponse(
-                file_stream,
+            response = StreamingResponse(
+                storage.stream_file(task_file.stored_filename),  # type: ignore
                 media_type=task_file.content_type or "application/octet-stream",  # type: ignore
                 headers={
-                    "Content-Disposition": f"attachment; filename='{task_file.original_filename}'"
+                    "Content-Disposition": _content_disposition(
+                        task_file.original_filename  # type: ignore
+                    )
                 },
             )
+
+        logger.info(
+            f"File download successful: file_id={file_id}, filename={task_file.original_filename}"
+        )
+        return response
     except FileNotFoundError:
         logger.error(f"Download failed: file not found: {task_file.stored_filename}")
         raise HTTPException(
@@ -241,15 +395,25 @@ async def download_file(
 @files_router.delete("/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_file(
     file_id: int,
+    background_tasks: BackgroundTasks,
     db_session: Session = Depends(get_db),
     current_user: db_models.User = Depends(get_current_user),
 ):
     """Delete a file by its ID"""
     logger.info(f"File delete request: file_id={file_id}, user_id={current_user.id}")
 
-    # Get the file record
+    # Select only the file columns used here plus the task owner for the
+    # permission check, rather than loading TaskFile and Task objects
     task_file = (
-        db_session.query(db_models.TaskFile)
+        db_session.query(
+            db_models.TaskFile.id,
+            db_models.TaskFile.task_id,
+            db_models.TaskFile.stored_filename,
+            db_models.TaskFile.original_filename,
+            db_models.TaskFile.content_type,
+            db_models.Task.user_id.label("owner_id"),
+        )
+        .join(db_models.Task, db_models.Task.id == db_models.TaskFile.task_id)
         .filter(db_models.TaskFile.id == file_id)
         .first()
     )
@@ -262,7 +426,13 @@ def delete_file(
         )
 
     # Verify user has permission to access the parent task
-    require_task_access(task_file.task, current_user, db_session, TaskPermission.EDIT)
+    require_task_access_by_id(
+        task_file.task_id,
+        task_file.owner_id,
+        current_user,
+        db_session,
+        TaskPermission.EDIT,
+    )
 
     # Save filename before deleting from DB
     stored_filename: str = task_file.stored_filename  # type: ignore
@@ -273,16 +443,13 @@ def delete_file(
     )
 
     # Delete from database
-    db_session.delete(task_file)
+    db_session.query(db_models.TaskFile).filter(
+        db_models.TaskFile.id == file_id
+    ).delete(synchronize_session=False)
     db_session.commit()
 
-    # Delete file using storage abstraction
-    try:
-        storage.delete_file(stored_filename)
-        logger.info(f"Deleted file from storage: {stored_filename}")
-    except Exception as e:
-        # Log warning but don't fail - file might already be gone
-        logger.warning(f"File deletion warning for {stored_filename}: {e}")
+    # Remove from storage after the response is sent
+    background_tasks.add_task(delete_stored_files, [stored_filename])
 
     logger.info(
         f"File deleted successfully: file_id={file_id}, filename={original_filename}"
@@ -1,5 +1,7 @@
 import logging
 import os
+import threading
+import time
 
 from fastapi import APIRouter, Depends, status
 from sqlalchemy import text
@@ -11,25 +13,57 @@ from db_config import get_db
 router = APIRouter(tags=["health"])
 logger = logging.getLogger(__name__)
 
+# Frequent liveness probes reuse the last database check for this many seconds
+HEALTH_CACHE_TTL = 2.0
+
+# (monotonic timestamp, db status) of the last database check in this worker
+_last_db_check: tuple[float, str] = (0.0, "unknown")
+_db_check_lock = threading.Lock()
+
+
+def _check_database(db_session: Session) -> str:
+    """Run SELECT 1 and report "healthy" or "unhealthy"."""
+    try:
+        db_session.execute(text("SELECT 1"))
+        logger.info("Health check passed: database connection OK")
+        return "healthy"
+    except SQLAlchemyError as e:
+        logger.error(f"Health check failed: database error - {e}")
+        return "unhealthy"
+
 
 @router.get("/health", status_code=status.HTTP_200_OK)
 def health_check(db_session: Session = Depends(get_db)):
     """
     Health check endpoint for monitoring.
     Returns API status and database connectivity.
+    The database result is cached for HEALTH_CACHE_TTL seconds per worker,
+    so probes don't each take a pooled connection. Use /health/deep to
+    always hit the database.
     """
-    try:
-        # Test database connection
-        db_session.execute(text("SELECT 1"))
-        db_status = "healthy"
-        logger.info("Health check passed: database connection OK")
-    except SQLAlchemyError as e:
-        db_status = "unhealthy"
-        logger.error(f"Health check failed: database error - {e}")
+    global _last_db_check
+
+    # The lock makes concurrent probes wait for one check instead of all
+    # querying the database at once when the cached result expires
+    with _db_check_lock:
+        checked_at, db_status = _last_db_check
+        now = time.monotonic()
+        if now - checked_at >= HEALTH_CACHE_TTL:
+            db_status = _check_database(db_session)
+            _last_db_check = (now, db_status)
 
     return {"status": "ok", "database": db_status}
 
 
+@router.get("/health/deep", status_code=status.HTTP_200_OK)
+def deep_health_check(db_session: Session = Depends(get_db)):
+    """
+    Uncached health check.
+    Always runs SELECT 1 against the database.
+    """
+    return {"status": "ok", "database": _check_database(db_session)}
+
+
 @router.get("/version")
 def get_version():
     return {"version": "0.1.0", "environment": os.getenv("ENVIRONMENT", "development")}
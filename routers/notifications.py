@@ -1,11 +1,19 @@
 import logging
 import os
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    status,
+)
+from sqlalchemy.orm import Session, joinedload
 
 import db_models
-from core.tokens import generate_token, verify_token_expiration
+from core.rate_limit_config import limiter
+from core.tokens import generate_token, hash_token, verify_token_expiration
 from db_config import get_db
 from dependencies import get_current_user
 from schemas.auth import VerifyEmailRequest
@@ -13,9 +21,9 @@ from schemas.notification import (
     NotificationPreferenceResponse,
     NotificationPreferenceUpdate,
 )
+from services.background_tasks import deliver_verification_email
 from services.notifications import (
     get_or_create_preferences,
-    send_direct_email,
     subscribe_user_to_notifications,
 )
 
@@ -24,6 +32,9 @@ FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 logger = logging.getLogger(__name__)
 
+# Token guesses are counted per IP across both verify endpoints (GET and POST)
+verify_attempt_limit = limiter.shared_limit("5/minute", scope="email_verify")
+
 
 @router.get("/preferences", response_model=NotificationPreferenceResponse)
 def get_notification_preferences(
@@ -42,7 +53,7 @@ def update_notification_preferences(
     current_user: db_models.User = Depends(get_current_user),
 ):
     """Update notification preferences"""
-    logger.info(f"Updating notification preferences for user_id={current_user.id}")
+    logger.info("Updating notification preferences for user_id=%s", current_user.id)
 
     prefs = get_or_create_preferences(current_user.id, db_session)  # type: ignore
 
@@ -67,7 +78,7 @@ def subscribe_to_notifications(
     With Resend: No subscription needed - user is automatically ready to receive emails.
     With AWS SNS: Would send confirmation email (not implemented for simplicity).
     """
-    logger.info(f"Subscribing user_id={current_user.id} to notifications")
+    logger.info("Subscribing user_id=%s to notifications", current_user.id)
 
     # Subscribe (with Resend, this is a no-op but kept for API compatibility)
     subscription_arn = subscribe_user_to_notifications(current_user.email)  # type: ignore
@@ -89,9 +100,11 @@ def _verify_email_token(token: str, db_session: Session):
     Internal function to verify email token.
     Returns user if valid, raises HTTPException if invalid.
     """
+    # Preferences are joined in so they can be updated without a second lookup
     user = (
         db_session.query(db_models.User)
-        .filter(db_models.User.verification_code == token)
+        .options(joinedload(db_models.User.notification_preferences))
+        .filter(db_models.User.verification_code == hash_token(token))
         .first()
     )
 
@@ -111,17 +124,23 @@ def _verify_email_token(token: str, db_session: Session):
     user.verification_code = None  # type: ignore
     user.verification_expires = None  # type: ignore
 
-    prefs = get_or_create_preferences(user.id, db_session)  # type: ignore
+    prefs = user.notification_preferences
+    if prefs is None:
+        # Default preferences are created in the same commit as the verification
+        prefs = db_models.NotificationPreference(user_id=user.id)
+        db_session.add(prefs)
     prefs.email_verified = True  # type: ignore
 
     db_session.commit()
 
-    logger.info(f"Email verified successfully for user_id={user.id}")
+    logger.info("Email verified successfully for user_id=%s", user.id)
     return user
 
 
 @router.get("/verify", status_code=status.HTTP_200_OK)
+@verify_attempt_limit
 def verify_email_get(
+    request: Request,  # pylint: disable=unused-argument
     token: str,
     db_session: Session = Depends(get_db),
 ):
@@ -144,8 +163,10 @@ def verify_email_get(
 
 
 @router.post("/verify", status_code=status.HTTP_200_OK)
+@verify_attempt_limit
 def mark_email_verified(
-    request: VerifyEmailRequest,
+    request: Request,  # pylint: disable=unused-argument
+    verify_data: VerifyEmailRequest,
     db_session: Session = Depends(get_db),
 ):
     """
@@ -154,7 +175,7 @@ def mark_email_verified(
     """
     logger.info("Email verification attempt (POST)")
 
-    user = _verify_email_token(request.token, db_session)
+    user = _verify_email_token(verify_data.token, db_session)
 
     return {
         "message": "Email verified successfully",
@@ -163,21 +184,25 @@ def mark_email_verified(
 
 
 @router.post("/send-verification", status_code=status.HTTP_200_OK)
+@limiter.limit("5/hour")  # Each call sends an email; keyed per user
 def send_verification_email(
+    request: Request,  # pylint: disable=unused-argument
+    background_tasks: BackgroundTasks,
     db_session: Session = Depends(get_db),
     current_user: db_models.User = Depends(get_current_user),
 ):
     """
     Generate verification token and send email.
-    User must be authenticated to request verification
+    User must be authenticated to request verification.
+    The email is sent in the background after the response.
     """
-    logger.info(f"Sending verification email to user_id={current_user.id}")
+    logger.info("Sending verification email to user_id=%s", current_user.id)
 
     # Generate token
     token, expires_at = generate_token(expiration_hours=24)
 
-    # Store token with 24hr exp
-    current_user.verification_code = token  # type: ignore
+    # Store only the token's hash with 24hr exp; the raw token goes in the email
+    current_user.verification_code = hash_token(token)  # type: ignore
     current_user.verification_expires = expires_at  # type: ignore
     db_session.commit()
 
@@ -226,19 +251,15 @@ FAROS Task Manager
 </html>
     """
 
-    success = send_direct_email(
+    background_tasks.add_task(
+        deliver_verification_email,
+        user_id=current_user.id,  # type: ignore
         recipient_email=current_user.email,  # type: ignore
         subject=subject,
         body_text=body_text,
         body_html=body_html,
     )
 
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to send verification email",
-        )
-
     return {
         "message": "Verification email sent",
         "email": current_user.email,
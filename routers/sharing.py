@@ -1,11 +1,32 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Response,
+    status,
+)
+from pydantic import TypeAdapter
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 import db_models
 from core import exceptions
-from core.redis_config import invalidate_user_cache
+from core.redis_config import (
+    SHARED_TASKS_CACHE_TTL,
+    get_cache,
+    invalidate_user_cache,
+    set_cache,
+    shared_tasks_cache_key,
+)
 from db_config import get_db
-from dependencies import TaskPermission, get_current_user, require_task_access
+from dependencies import (
+    TaskPermission,
+    get_current_user,
+    require_task_access,
+    require_task_access_by_id,
+)
 from schemas.sharing import (
     SharedTaskResponse,
     TaskShareCreate,
@@ -17,6 +38,9 @@ from services.background_tasks import notify_task_shared
 
 sharing_router = APIRouter(prefix="/tasks", tags=["sharing"])
 
+# Serializes the shared-with-me list once, for both the response and the cache
+_shared_tasks_adapter = TypeAdapter(list[SharedTaskResponse])
+
 
 @sharing_router.get("/shared-with-me", response_model=list[SharedTaskResponse])
 def get_shared_tasks(
@@ -25,23 +49,37 @@ def get_shared_tasks(
 ):
     """Get all tasks that have been shared with the current user"""
 
-    # Query for shares where current user is the recipient
+    # Serve the serialized list from Redis when present; share changes for this
+    # user invalidate it (see invalidate_user_cache)
+    cache_key = shared_tasks_cache_key(current_user.id)  # type: ignore
+    cached_body = get_cache(cache_key)
+    if cached_body:
+        return Response(content=cached_body, media_type="application/json")
+
+    # Query for shares where current user is the recipient. The many-to-one
+    # task/owner path is joined; the task's comments and shares (serialized in
+    # the response) are collections, so each is fetched in one selectin query
+    # rather than lazily per task. raiseload guards against new lazy loads
     shares = (
         db_session.query(db_models.TaskShare)
-        .options(joinedload(db_models.TaskShare.task).joinedload(db_models.Task.owner))
+        .options(
+            joinedload(db_models.TaskShare.task).joinedload(db_models.Task.owner),
+            joinedload(db_models.TaskShare.task).selectinload(db_models.Task.comments),
+            joinedload(db_models.TaskShare.task).selectinload(db_models.Task.shares),
+            joinedload(db_models.TaskShare.task).raiseload("*"),
+            raiseload("*"),
+        )
         .filter(db_models.TaskShare.shared_with_user_id == current_user.id)
         .all()
     )
 
-    return [
-        {
-            "task": share.task,
-            "permission": share.permission,
-            "is_owner": False,
-            "owner_username": share.task.owner.username,
-        }
-        for share in shares
-    ]
+    # Validated straight from the ORM objects (see SharedTaskResponse aliases)
+    body = _shared_tasks_adapter.dump_json(
+        _shared_tasks_adapter.validate_python(shares, from_attributes=True)
+    )
+    set_cache(cache_key, body.decode(), ttl=SHARED_TASKS_CACHE_TTL)
+
+    return Response(content=body, media_type="application/json")
 
 
 @sharing_router.get("/{task_id}/shares", response_model=list[TaskShareResponse])
@@ -61,22 +99,13 @@ def get_task_shares(
 
     shares = (
         db_session.query(db_models.TaskShare)
-        .options(joinedload(db_models.TaskShare.shared_with))
+        .options(joinedload(db_models.TaskShare.shared_with), raiseload("*"))
         .filter(db_models.TaskShare.task_id == task_id)
         .all()
     )
 
-    return [
-        {
-            "id": share.id,
-            "task_id": share.task_id,
-            "shared_with_user_id": share.shared_with_user_id,
-            "shared_with_username": share.shared_with.username,
-            "permission": share.permission,
-            "shared_at": share.shared_at,
-        }
-        for share in shares
-    ]
+    # Validated straight from the ORM objects (see TaskShareResponse aliases)
+    return shares
 
 
 @sharing_router.post(
@@ -93,20 +122,27 @@ def share_task(
 ):
     """Share a task with another user"""
 
-    # Get the task
-    task = db_session.query(db_models.Task).filter(db_models.Task.id == task_id).first()
+    # Get the task's owner and title together with the user to share with
+    # (outer join, so a missing user still returns the task row)
+    row = (
+        db_session.query(db_models.Task.user_id, db_models.Task.title, db_models.User)
+        .select_from(db_models.Task)
+        .outerjoin(
+            db_models.User,
+            db_models.User.username == share_data.shared_with_username,
+        )
+        .filter(db_models.Task.id == task_id)
+        .first()
+    )
 
-    if not task:
+    if not row:
         raise exceptions.TaskNotFoundError(task_id=task_id)
 
-    # Only owner can share
-    require_task_access(task, current_user, db_session, TaskPermission.OWNER)
+    owner_id, task_title, shared_with_user = row
 
-    # Look up user to share with
-    shared_with_user = (
-        db_session.query(db_models.User)
-        .filter(db_models.User.username == share_data.shared_with_username)
-        .first()
+    # Only owner can share
+    require_task_access_by_id(
+        task_id, owner_id, current_user, db_session, TaskPermission.OWNER
     )
 
     if not shared_with_user:
@@ -122,32 +158,26 @@ def share_task(
             detail="Cannot share task with yourself",
         )
 
-    # Check if already shared
-    existing_share = (
-        db_session.query(db_models.TaskShare)
-        .filter(
-            db_models.TaskShare.task_id == task_id,
-            db_models.TaskShare.shared_with_user_id == shared_with_user.id,
+    # Create the share. The unique (task_id, shared_with_user_id) constraint does
+    # the duplicate check: no row comes back if the task is already shared
+    share = db_session.execute(
+        pg_insert(db_models.TaskShare)
+        .values(
+            task_id=task_id,
+            shared_with_user_id=shared_with_user.id,
+            shared_by_user_id=current_user.id,
+            permission=share_data.permission,
         )
-        .first()
-    )
+        .on_conflict_do_nothing(index_elements=["task_id", "shared_with_user_id"])
+        .returning(db_models.TaskShare.id, db_models.TaskShare.shared_at)
+    ).first()
 
-    if existing_share:
+    if share is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Task already shared with this user",
         )
 
-    # Creat the share
-    share = db_models.TaskShare(
-        task_id=task_id,
-        shared_with_user_id=shared_with_user.id,
-        shared_by_user_id=current_user.id,
-        permission=share_data.permission,
-    )
-
-    db_session.add(share)
-
     activity_service.log_task_shared(
         db_session=db_session,
         user_id=current_user.id,  # type: ignore
@@ -156,30 +186,32 @@ def share_task(
         permission=share_data.permission,
     )
 
-    db_session.commit()
-    db_session.refresh(share)
-
-    # Trigger the background notification
+    # Read everything needed from the loaded objects before commit expires them;
+    # background tasks only run once the response is sent, i.e. after the commit
     background_tasks.add_task(
         notify_task_shared,
         recipient_user_id=shared_with_user.id,  # type: ignore
         recipient_email=shared_with_user.email,  # type: ignore
-        task_title=task.title,  # type: ignore
+        task_title=task_title,
         sharer_username=current_user.username,  # type: ignore
         permission=share_data.permission,
     )
-
-    invalidate_user_cache(current_user.id)  # type: ignore
-
-    return {
+    recipient_id = shared_with_user.id
+    response = {
         "id": share.id,
-        "task_id": share.task_id,
-        "shared_with_user_id": share.shared_with_user_id,
+        "task_id": task_id,
+        "shared_with_user_id": shared_with_user.id,
         "shared_with_username": shared_with_user.username,
-        "permission": share.permission,
+        "permission": share_data.permission,
         "shared_at": share.shared_at,
     }
 
+    db_session.commit()
+
+    invalidate_user_cache(owner_id, recipient_id)  # type: ignore
+
+    return response
+
 
 @sharing_router.put("/{task_id}/share/{username}")
 def update_share_permission(
@@ -233,11 +265,14 @@ def update_share_permission(
     db_session.commit()
     db_session.refresh(share)
 
+    # The recipient's shared-with-me list shows the permission
+    invalidate_user_cache(user.id)  # type: ignore
+
     return {
         "id": share.id,
         "task_id": share.task_id,
         "shared_with_user_id": share.shared_with_user_id,
-        "shared_with_username": share.shared_with.username,
+        "shared_with_username": user.username,
         "permission": share.permission,
         "shared_at": share.shared_at,
     }
@@ -263,35 +298,33 @@ def unshare_task(
     # Only owner can unshare
     require_task_access(task, current_user, db_session, TaskPermission.OWNER)
 
-    # Find the share
-    share = (
-        db_session.query(db_models.TaskShare)
-        .join(
-            db_models.User, db_models.TaskShare.shared_with_user_id == db_models.User.id
-        )
-        .options(joinedload(db_models.TaskShare.shared_with))
-        .filter(
+    # Delete the share, resolving the username in the same statement
+    # (DELETE ... USING users ... RETURNING the unshared user's id and username)
+    unshared_user = db_session.execute(
+        delete(db_models.TaskShare)
+        .where(
             db_models.TaskShare.task_id == task_id,
+            db_models.TaskShare.shared_with_user_id == db_models.User.id,
             db_models.User.username == username,
         )
-        .first()
-    )
+        .returning(db_models.User.id, db_models.User.username)
+        .execution_options(synchronize_session=False)
+    ).first()
 
-    if not share:
+    if not unshared_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task is not shared with user '{username}",
+            detail=f"Task is not shared with user '{username}'",
         )
 
     activity_service.log_task_unshared(
         db_session=db_session,
         user_id=current_user.id,  # type: ignore
         task_id=task_id,
-        unshared_user=share.shared_with,
+        unshared_user=unshared_user,  # type: ignore
     )
 
-    # Delete the share
-    db_session.delete(share)
+    owner_id = current_user.id
     db_session.commit()
 
-    invalidate_user_cache(current_user.id)  # type: ignore
+    invalidate_user_cache(owner_id, unshared_user.id)  # type: ignore
@@ -1,9 +1,11 @@
+import base64
+import binascii
 import json
 import logging
 import time
-from collections import Counter
-from datetime import date, datetime
-from typing import Any, Literal, Optional
+from datetime import date
+from functools import singledispatch
+from typing import Any, Callable, Literal, Optional
 
 from fastapi import (
     APIRouter,
@@ -12,19 +14,33 @@ from fastapi import (
     HTTPException,
     Query,
     Request,
+    Response,
     status,
 )
-from sqlalchemy import distinct, func
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy import all_, distinct, func, literal, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, defer, joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 import db_models
 from core import exceptions
 from core.rate_limit_config import limiter
-from core.redis_config import get_cache, invalidate_user_cache, set_cache
+from core.redis_config import (
+    TASK_LIST_CACHE_TTL,
+    get_cache,
+    invalidate_user_cache,
+    set_cache,
+    task_list_cache_key,
+)
 from db_config import get_db
-from dependencies import TaskPermission, get_current_user, require_task_access
+from dependencies import (
+    TaskPermission,
+    batch_require_task_access,
+    get_current_user,
+    require_task_access,
+)
 from schemas.task import (
+    BulkTaskCreate,
     BulkTaskUpdate,
     PaginatedTasks,
     Task,
@@ -39,20 +55,67 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 logger = logging.getLogger(__name__)
 
 
+@singledispatch
 def serialize_value(value: Any) -> Any:
     """Convert non-JSON serializable types to JSON-compatible formats."""
-    if isinstance(value, (date, datetime)):
-        return value.isoformat()
+    # Dispatch is on type(value): scalars land here after one lookup
+    return value
+
+
+@serialize_value.register
+def _(value: date) -> str:  # also datetime, a date subclass
+    return value.isoformat()
+
+
+@serialize_value.register
+def _(value: list) -> list:
+    return [serialize_value(item) for item in value]
+
 
-    if isinstance(value, list):
-        return [serialize_value(item) for item in value]
+@serialize_value.register
+def _(value: dict) -> dict:
+    return {k: serialize_value(v) for k, v in value.items()}
 
-    if isinstance(value, dict):
-        return {k: serialize_value(v) for k, v in value.items()}
 
+def _as_is(value: Any) -> Any:
     return value
 
 
+# Activity log serializers for the TaskUpdate fields: scalars pass through,
+# so only the date and the tags array need converting. Columns not listed
+# fall back to serialize_value
+TASK_FIELD_SERIALIZERS: dict[str, Callable[[Any], Any]] = {
+    "title": _as_is,
+    "description": _as_is,
+    "completed": _as_is,
+    "priority": _as_is,
+    "due_date": lambda value: value.isoformat() if value else None,
+    "tags": lambda value: list(value) if value is not None else None,
+}
+
+
+def serialize_field(field: str, value: Any) -> Any:
+    """Serialize one Task column's value for the activity log"""
+    return TASK_FIELD_SERIALIZERS.get(field, serialize_value)(value)
+
+
+def encode_cursor(sort_value: Any, task_id: int) -> str:
+    """Opaque pagination cursor: the last task's sort value and id"""
+    payload = json.dumps([serialize_value(sort_value), task_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[Any, int]:
+    """Inverse of encode_cursor; raises 400 for anything malformed"""
+    try:
+        sort_value, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_value, int(task_id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from e
+
+
 # --- Endpoints ---
 
 
@@ -78,10 +141,28 @@ def get_all_tasks(
     sort_order: Literal["asc", "desc"] = "asc",
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="next_cursor from the previous page; takes precedence over skip",
+    ),
 ):
     """Retrieve all tasks with optional filtering"""
     logger.info(f"Retrieving all tasks for user_id={current_user.id}")
 
+    # Unfiltered pages (dashboards, first page) are served from Redis
+    filters = (completed, priority, tags, overdue, search)
+    date_filters = (created_after, created_before, due_after, due_before)
+    cache_key = None
+    if cursor is None and all(f is None for f in filters + date_filters):
+        cache_key = task_list_cache_key(
+            current_user.id, sort_by, sort_order, skip, limit  # type: ignore
+        )
+    if cache_key:
+        cached = get_cache(cache_key)
+        if cached:
+            logger.info(f"Task list cache hit for user_id={current_user.id}")
+            return Response(content=cached, media_type="application/json")
+
     # Start with base query
     query = db_session.query(db_models.Task).filter(
         db_models.Task.user_id == current_user.id
@@ -124,7 +205,7 @@ def get_all_tasks(
         query = query.filter(db_models.Task.due_date <= due_before)
 
     # Overdue filter
-    if overdue:
+    if overdue is not None:
         today = date.today()
         if overdue:
             query = query.filter(
@@ -139,28 +220,103 @@ def get_all_tasks(
                 | (db_models.Task.due_date >= today)
             )
 
-    # Apply sorting
-    if sort_by:
-        sort_column = getattr(db_models.Task, sort_by)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
+    filtered_query = query
+
+    # Apply sorting, always ending on id so the order is total and a cursor
+    # (sort value, id) identifies an exact position in it
+    descending = sort_order == "desc"
+    sort_key = None
+    if sort_by and sort_by != "id":
+        if sort_by == "priority":
+            sort_key = db_models.PRIORITY_RANK
         else:
-            query = query.order_by(sort_column)
+            sort_key = getattr(db_models.Task, sort_by)
+        sort_column = sort_key.desc() if descending else sort_key.asc()
+        if sort_by == "due_date":
+            # Tasks without a due date go last in either direction
+            sort_column = sort_column.nulls_last()
+        query = query.order_by(sort_column)
+    query = query.order_by(
+        db_models.Task.id.desc() if descending else db_models.Task.id.asc()
+    )
 
-    total_count = query.count()
+    # Apply pagination: keyset when a cursor is given (an index seek past the
+    # previous page), otherwise offset
+    if cursor:
+        # The keyset filter would narrow a window count, so count separately
+        total_count = filtered_query.count()
+        after_value, after_id = decode_cursor(cursor)
+        if descending:
+            after_id_clause = db_models.Task.id < after_id
+        else:
+            after_id_clause = db_models.Task.id > after_id
+        if sort_key is None:
+            query = query.filter(after_id_clause)
+        elif sort_by == "due_date" and after_value is None:
+            # Already in the trailing run of tasks without a due date
+            query = query.filter(db_models.Task.due_date.is_(None), after_id_clause)
+        else:
+            keyset = tuple_(sort_key, db_models.Task.id)
+            position = (after_value, after_id)  # bound with the keyset's types
+            after_clause = keyset < position if descending else keyset > position
+            if sort_by == "due_date":
+                after_clause = or_(after_clause, db_models.Task.due_date.is_(None))
+            query = query.filter(after_clause)
+    else:
+        # The total rides along on every row as a window count over the
+        # filtered set, saving a separate COUNT round-trip
+        query = query.add_columns(func.count().over().label("total"))
+        query = query.offset(skip)
+
+    # Comments and shares are serialized for every task, so load them in one
+    # query each rather than one per task. Only share ids are needed for
+    # share_count, and notes isn't part of the response
+    query = query.options(
+        selectinload(db_models.Task.comments),
+        selectinload(db_models.Task.shares).load_only(db_models.TaskShare.id),
+        defer(db_models.Task.notes),
+    )
 
-    # Apply pagination
-    tasks = query.offset(skip).limit(limit).all()
+    # Fetch one extra row to know whether another page follows
+    rows = query.limit(limit + 1).all()
+    if cursor:
+        tasks = rows
+    else:
+        tasks = [row[0] for row in rows]
+        if rows:
+            total_count = rows[0].total
+        else:
+            # Past the last page, so no row carried the total
+            total_count = filtered_query.count() if skip else 0
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        last_task = tasks[-1]
+        if sort_by == "priority":
+            last_value = db_models.PRIORITY_ORDER[last_task.priority]  # type: ignore
+        elif sort_key is not None:
+            last_value = getattr(last_task, sort_by)  # type: ignore
+        else:
+            last_value = None
+        next_cursor = encode_cursor(last_value, last_task.id)  # type: ignore
 
     logger.info(
         f"Successfully retrieved {len(tasks)} tasks for user_id={current_user.id}"
     )
-    return {
+    result = {
         "tasks": tasks,
         "total": total_count,
         "page": skip // limit + 1,
         "pages": (total_count + limit - 1) // limit,
+        "next_cursor": next_cursor,
     }
+    if not cache_key:
+        return result
+
+    page = PaginatedTasks.model_validate(result, from_attributes=True)
+    content = page.model_dump_json()
+    set_cache(cache_key, content, ttl=TASK_LIST_CACHE_TTL)
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/stats", response_model=TaskStats)
@@ -176,58 +332,67 @@ def get_task_stats(
     cached_stats = get_cache(cache_key)
 
     if cached_stats:
-        # Cache hit - Return cached data
-        stats_dict = json.loads(cached_stats)
+        # Cache hit - the cached value is already the JSON body, so send it
+        # as-is instead of parsing, validating and re-encoding it
         elapsed_time = (time.time() - start_time) * 1000
         logger.info(
             f"Returning cached statistics for user_id={current_user.id} "
             f"| Time: {elapsed_time:.2f}ms"
         )
-        return stats_dict
+        return Response(content=cached_stats, media_type="application/json")
 
     # Cache miss - calculate stats from database
     logger.info(f"Calculating fresh statistics for user_id={current_user.id}")
 
-    all_tasks: list[db_models.Task] = (
-        db_session.query(db_models.Task)
-        .filter(db_models.Task.user_id == current_user.id)
+    # Aggregate in the database rather than loading every task row
+    owned = db_models.Task.user_id == current_user.id
+    today = date.today()
+
+    # One scan grouped by priority; the totals are sums over its (at most
+    # three) rows
+    priority_rows = (
+        db_session.query(
+            db_models.Task.priority,
+            func.count(),
+            func.count().filter(db_models.Task.completed.is_(True)),
+            func.count().filter(
+                db_models.Task.due_date.isnot(None),
+                db_models.Task.completed.is_(False),
+                db_models.Task.due_date < today,
+            ),
+        )
+        .filter(owned)
+        .group_by(db_models.Task.priority)
         .all()
     )
-
-    total = len(all_tasks)
-    completed = sum(1 for t in all_tasks if t.completed is True)
+    by_priority = {priority: count for priority, count, _, _ in priority_rows}
+    total = sum(by_priority.values())
+    completed = sum(row[2] for row in priority_rows)
+    overdue = sum(row[3] for row in priority_rows)
     incomplete = total - completed
 
-    # Count by priority
-    by_priority = Counter(t.priority for t in all_tasks)
-
-    # Count by tag (each tag counted seperately)
-    all_tags = []
-    for task in all_tasks:
-        all_tags.extend(task.tags)  # type: ignore[arg-type]
-    by_tag = Counter(all_tags)
-
-    # Count overdue tasks
-    today = date.today()
-    overdue = sum(
-        1
-        for t in all_tasks
-        if t.due_date is not None  # type: ignore[arg-type]
-        and not t.completed  # type: ignore[arg-type]
-        and t.due_date < today
+    # Count by tag (each tag counted seperately). unnest() can't appear in
+    # GROUP BY, so tags are expanded in a subquery first
+    task_tags = (
+        db_session.query(func.unnest(db_models.Task.tags).label("tag"))
+        .filter(owned)
+        .subquery()
+    )
+    by_tag = dict(
+        db_session.query(task_tags.c.tag, func.count())
+        .group_by(task_tags.c.tag)
+        .all()
     )
 
-    tasks_shared = (
+    # Both counts from other tables, as scalar subqueries of one SELECT
+    tasks_shared, comments_posted = db_session.query(
         db_session.query(func.count(distinct(db_models.TaskShare.task_id)))
         .filter(db_models.TaskShare.shared_by_user_id == current_user.id)
-        .scalar()
-    )
-
-    comments_posted = (
-        db_session.query(db_models.TaskComment)
+        .scalar_subquery(),
+        db_session.query(func.count(db_models.TaskComment.id))
         .filter(db_models.TaskComment.user_id == current_user.id)
-        .count()
-    )
+        .scalar_subquery(),
+    ).one()
 
     logger.info(f"Successfully retrieved task statistics for user_id={current_user.id}")
 
@@ -235,8 +400,8 @@ def get_task_stats(
         "total": total,
         "completed": completed,
         "incomplete": incomplete,
-        "by_priority": dict(by_priority),
-        "by_tag": dict(by_tag),
+        "by_priority": by_priority,
+        "by_tag": by_tag,
         "overdue": overdue,
         "tasks_shared": tasks_shared,
         "comments_posted": comments_posted,
@@ -271,10 +436,10 @@ def bulk_update_tasks(
             detail="No fields provided for update",
         )
 
-    # Query all tasks with the given IDs
-
+    # Look up just the ids and owners: enough to validate and authorize, without
+    # loading full task rows that the UPDATE below never reads
     tasks = (
-        db_session.query(db_models.Task)
+        db_session.query(db_models.Task.id, db_models.Task.user_id)
         .filter(db_models.Task.id.in_(bulk_data.task_ids))
         .all()
     )
@@ -298,17 +463,19 @@ def bulk_update_tasks(
             detail=f"Tasks not found: {missing_ids}",
         )
 
-    for task in tasks:
-        require_task_access(task, current_user, db_session, TaskPermission.EDIT)
+    batch_require_task_access(tasks, current_user, db_session, TaskPermission.EDIT)
 
     logger.info(
         f"Bulk update authorized for user_id{current_user.id} on {len(tasks)} tasks"
     )
 
-    # Update each task
-    for task in tasks:
-        for field, value in update_data.items():
-            setattr(task, field, value)
+    # Shared tasks with edit access may belong to other users
+    owner_ids = {task.user_id for task in tasks}
+
+    # Every task gets the same values, so apply them in one UPDATE ... WHERE id IN
+    db_session.query(db_models.Task).filter(
+        db_models.Task.id.in_(bulk_data.task_ids)
+    ).update(update_data, synchronize_session=False)
 
     db_session.commit()
 
@@ -316,13 +483,21 @@ def bulk_update_tasks(
         f"Bulk update completed: {len(tasks)} tasks updated for user_id={current_user.id}"
     )
 
-    # Invalidate stats cache since task count changed
-    invalidate_user_cache(current_user.id)  # type: ignore
-
-    for task in tasks:
-        db_session.refresh(task)
+    # Invalidate every affected owner's stats cache
+    invalidate_user_cache(*owner_ids)  # type: ignore
 
-    return tasks
+    # Reload the updated rows in one SELECT (plus one per serialized collection)
+    # instead of refreshing each task; same projection as the task list
+    return (
+        db_session.query(db_models.Task)
+        .options(
+            selectinload(db_models.Task.comments),
+            selectinload(db_models.Task.shares).load_only(db_models.TaskShare.id),
+            defer(db_models.Task.notes),
+        )
+        .filter(db_models.Task.id.in_(bulk_data.task_ids))
+        .all()
+    )
 
 
 @router.get("/{task_id}", response_model=Task)
@@ -335,9 +510,14 @@ def get_task_id(
 
     logger.info(f"Fetching task_id={task_id} for user_id={current_user.id}")
 
+    # Declare everything the response reads; any other lazy load raises
     task = (
         db_session.query(db_models.Task)
-        .options(selectinload(db_models.Task.shares))  # ← ADD THIS
+        .options(
+            selectinload(db_models.Task.comments),
+            selectinload(db_models.Task.shares).load_only(db_models.TaskShare.id),
+            raiseload("*"),
+        )
         .filter(db_models.Task.id == task_id)
         .first()
     )
@@ -354,6 +534,27 @@ def get_task_id(
     return task
 
 
+def new_task_response(task: db_models.Task) -> dict[str, Any]:
+    """
+    Response body for a task that was just inserted.
+    A new task has no comments or shares, and created_at came back with the
+    INSERT (eager_defaults), so this needs no reload after commit expires it.
+    """
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "completed": task.completed,
+        "priority": task.priority,
+        "created_at": task.created_at,
+        "due_date": task.due_date,
+        "tags": task.tags,
+        "user_id": task.user_id,
+        "comments": [],
+        "share_count": 0,
+    }
+
+
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=Task)
 @limiter.limit("100/hour")  # 100 tasks per hour
 def create_task(
@@ -382,17 +583,58 @@ def create_task(
     activity_service.log_task_created(
         db_session=db_session, user_id=current_user.id, task=new_task  # type: ignore
     )
+    response = new_task_response(new_task)
     db_session.commit()
-    db_session.refresh(new_task)
 
     logger.info(
-        f"Task created successfully: task_id={new_task.id}, user_id={current_user.id}"
+        f"Task created successfully: task_id={response['id']}, user_id={current_user.id}"
     )
 
     # Invalidate stats cache since task count changed
     invalidate_user_cache(current_user.id)  # type: ignore
 
-    return new_task
+    return response
+
+
+@router.post("/bulk", status_code=status.HTTP_201_CREATED, response_model=list[Task])
+@limiter.limit("10/hour")
+def bulk_create_tasks(
+    request: Request,  # pylint: disable=unused-argument
+    bulk_data: BulkTaskCreate,
+    db_session: Session = Depends(get_db),
+    current_user: db_models.User = Depends(get_current_user),
+):
+    """Create multiple tasks in one transaction"""
+
+    logger.info(
+        f"Bulk creating {len(bulk_data.tasks)} tasks for user_id={current_user.id}"
+    )
+
+    new_tasks = [
+        db_models.Task(**task_data.model_dump(), user_id=current_user.id)
+        for task_data in bulk_data.tasks
+    ]
+
+    # One flush batches the INSERTs (insertmanyvalues) and returns every id
+    db_session.add_all(new_tasks)
+    db_session.flush()
+
+    for new_task in new_tasks:
+        activity_service.log_task_created(
+            db_session=db_session,
+            user_id=current_user.id,  # type: ignore
+            task=new_task,
+        )
+    response = [new_task_response(new_task) for new_task in new_tasks]
+    db_session.commit()
+
+    logger.info(
+        f"Bulk create completed: {len(response)} tasks created for user_id={current_user.id}"
+    )
+
+    invalidate_user_cache(current_user.id)  # type: ignore
+
+    return response
 
 
 @router.patch("/{task_id}", response_model=Task)
@@ -406,8 +648,19 @@ def update_task(
     """Update a task"""
     logger.info(f"Updating task for user_id={current_user.id}: task_id={task_id}")
 
-    # Find the task
-    task = db_session.query(db_models.Task).filter(db_models.Task.id == task_id).first()
+    # Comments and shares feed the response, the owner's email the completion
+    # notification; any other lazy load raises
+    task = (
+        db_session.query(db_models.Task)
+        .options(
+            joinedload(db_models.Task.owner).load_only(db_models.User.email),
+            selectinload(db_models.Task.comments),
+            selectinload(db_models.Task.shares).load_only(db_models.TaskShare.id),
+            raiseload("*"),
+        )
+        .filter(db_models.Task.id == task_id)
+        .first()
+    )
 
     if not task:
         logger.warning(f"Task not found: task_id={task_id}")
@@ -426,7 +679,7 @@ def update_task(
 
     old_values = {}
     for field in update_data.keys():
-        old_values[field] = serialize_value(getattr(task, field))
+        old_values[field] = serialize_field(field, getattr(task, field))
 
     # Check if task is being marked as complete for first time
     was_incomplete = not task.completed  # type: ignore
@@ -438,7 +691,7 @@ def update_task(
 
     new_values = {}
     for field in update_data.keys():
-        new_values[field] = serialize_value(getattr(task, field))
+        new_values[field] = serialize_field(field, getattr(task, field))
 
     activity_service.log_task_updated(
         db_session=db_session,
@@ -448,8 +701,10 @@ def update_task(
         new_values=new_values,
     )
 
-    db_session.commit()
-    db_session.refresh(task)
+    # No task column is generated on UPDATE, so the in-memory task is already
+    # the response; build it before commit expires the task
+    response = Task.model_validate(task)
+    owner_id = task.user_id
 
     # Only send notification when task transitions from incomplete -> complete
     if was_incomplete and is_being_marked_complete:
@@ -464,14 +719,16 @@ def update_task(
                 completer_username=current_user.username,  # type: ignore
             )
 
+    db_session.commit()
+
     logger.info(
         f"Task updates successfully: task_id={task_id}, user_id={current_user.id}"
     )
 
-    # Invalidate stats cache since task count changed
-    invalidate_user_cache(current_user.id)  # type: ignore
+    # Invalidate the owner's stats cache; an editor may not be the owner
+    invalidate_user_cache(owner_id)  # type: ignore
 
-    return task
+    return response
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -485,7 +742,24 @@ def delete_task_id(
 
     logger.info(f"Deleting task_id={task_id} for user_id={current_user.id}")
 
-    task = db_session.query(db_models.Task).filter(db_models.Task.id == task_id).first()
+    # The delete cascades to files, comments and shares, so load each in one
+    # query up front, keyed rows only (plus file names for the disk cleanup);
+    # any other lazy load raises. The activity log doesn't read description
+    task = (
+        db_session.query(db_models.Task)
+        .options(
+            defer(db_models.Task.description),
+            defer(db_models.Task.notes),
+            selectinload(db_models.Task.files).load_only(
+                db_models.TaskFile.stored_filename
+            ),
+            selectinload(db_models.Task.comments).load_only(db_models.TaskComment.id),
+            selectinload(db_models.Task.shares).load_only(db_models.TaskShare.id),
+            raiseload("*"),
+        )
+        .filter(db_models.Task.id == task_id)
+        .first()
+    )
 
     if not task:
         logger.warning(f"Delete failed: task_id={task_id} not found")
@@ -508,7 +782,7 @@ def delete_task_id(
 
     background_tasks.add_task(
         cleanup_after_task_deletion,
-        task_id=task.id,  # type: ignore
+        task_id=task_id,
         task_title=task_title,  # type: ignore
         file_list=file_list,
     )
@@ -530,7 +804,16 @@ def add_tags(
     """Add tags to a task without removing existing tags"""
     logger.info(f"Adding tags for task_id={task_id} for user_id={current_user.id}")
 
-    task = db_session.query(db_models.Task).filter(db_models.Task.id == task_id).first()
+    task = (
+        db_session.query(db_models.Task)
+        .options(
+            selectinload(db_models.Task.comments),
+            selectinload(db_models.Task.shares).load_only(db_models.TaskShare.id),
+            raiseload("*"),
+        )
+        .filter(db_models.Task.id == task_id)
+        .first()
+    )
 
     if not task:
         logger.warning(f"Task not found: task_id={task_id}")
@@ -538,22 +821,49 @@ def add_tags(
 
     require_task_access(task, current_user, db_session, TaskPermission.EDIT)
 
-    # Add new tags, avoiding duplicates
-    for tag in tags:
-        if tag not in task.tags:
-            task.tags.append(tag)
-
-    # Mark the tags field as modified (PostgreSQL array needs this)
-    flag_modified(task, "tags")
+    # Duplicates within the request are dropped here; tags already on the task
+    # are filtered inside the UPDATE against the row being written, so two
+    # concurrent requests adding the same tag can't both append it
+    requested_tags = list(dict.fromkeys(tags))
+    added_count = 0
+
+    if requested_tags:
+        requested = (
+            func.unnest(literal(requested_tags, db_models.Task.tags.type))
+            .table_valued("tag", with_ordinality="ord")
+            .render_derived()
+        )
+        missing_tags = (
+            select(
+                func.array_agg(aggregate_order_by(requested.c.tag, requested.c.ord))
+            )
+            .where(requested.c.tag != all_(db_models.Task.tags))
+            .scalar_subquery()
+        )
+        updated_tags = db_session.execute(
+            update(db_models.Task)
+            .where(db_models.Task.id == task_id)
+            .values(tags=func.array_cat(db_models.Task.tags, missing_tags))
+            .returning(db_models.Task.tags)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
+        added_count = len(updated_tags) - len(task.tags)
+        set_committed_value(task, "tags", updated_tags)
+
+    # Build the response before commit expires the task
+    response = Task.model_validate(task)
+    owner_id = task.user_id
 
     db_session.commit()
-    db_session.refresh(task)
 
     logger.info(
-        f"Successfully added {len(tags)} tags for task_id={task_id}, user_id={current_user.id}"
+        f"Successfully added {added_count} tags for task_id={task_id}, user_id={current_user.id}"
     )
 
-    return task
+    # Stats count tasks per tag
+    invalidate_user_cache(owner_id)  # type: ignore
+
+    return response
 
 
 @router.delete("/{task_id}/tags/{tag}", response_model=Task)
@@ -566,7 +876,16 @@ def remove_tag(
     """Remove a specific tag from a task"""
     logger.info(f"Removing tag for task_id={task_id} for user_id={current_user.id}")
 
-    task = db_session.query(db_models.Task).filter(db_models.Task.id == task_id).first()
+    task = (
+        db_session.query(db_models.Task)
+        .options(
+            selectinload(db_models.Task.comments),
+            selectinload(db_models.Task.shares).load_only(db_models.TaskShare.id),
+            raiseload("*"),
+        )
+        .filter(db_models.Task.id == task_id)
+        .first()
+    )
 
     if not task:
         logger.warning(f"Task not found: task_id={task_id}")
@@ -578,11 +897,22 @@ def remove_tag(
         logger.warning(f"Tag not found: {tag} in task_id={task_id}")
         raise exceptions.TagNotFoundError(task_id=task_id, tag=tag)
 
-    task.tags.remove(tag)
+    updated_tags = db_session.execute(
+        update(db_models.Task)
+        .where(db_models.Task.id == task_id)
+        .values(tags=func.array_remove(db_models.Task.tags, tag))
+        .returning(db_models.Task.tags)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+    set_committed_value(task, "tags", updated_tags)
 
-    flag_modified(task, "tags")
+    # Build the response before commit expires the task
+    response = Task.model_validate(task)
+    owner_id = task.user_id
 
     db_session.commit()
-    db_session.refresh(task)
 
-    return task
+    # Stats count tasks per tag
+    invalidate_user_cache(owner_id)  # type: ignore
+
+    return response
@@ -9,6 +9,7 @@ class FileUploadResponse(BaseModel):
     original_filename: str
     file_size: int
     content_type: str | None
+    sha256: str | None = None
     uploaded_at: datetime
 
     class Config:
@@ -20,6 +21,7 @@ class TaskFileInfo(BaseModel):
     original_filename: str
     file_size: int
     content_type: str | None
+    sha256: str | None = None
     uploaded_at: datetime
 
     class Config:
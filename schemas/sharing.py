@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field
 
 from .task import Task
 
@@ -19,7 +19,12 @@ class TaskShareResponse(BaseModel):
     id: int
     task_id: int
     shared_with_user_id: int
-    shared_with_username: str  # Computer field
+    # Read from share.shared_with.username when validating a TaskShare object
+    shared_with_username: str = Field(
+        validation_alias=AliasChoices(
+            "shared_with_username", AliasPath("shared_with", "username")
+        )
+    )
     permission: str
     shared_at: datetime
 
@@ -31,8 +36,15 @@ class SharedTaskResponse(BaseModel):
 
     task: Task
     permission: str  # Your permission level
-    is_owner: bool  # Are you the owner?
-    owner_username: str
+    is_owner: bool = False  # Are you the owner?
+    # Read from share.task.owner.username when validating a TaskShare object
+    owner_username: str = Field(
+        validation_alias=AliasChoices(
+            "owner_username", AliasPath("task", "owner", "username")
+        )
+    )
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TaskShareUpdate(BaseModel):
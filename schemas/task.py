@@ -58,6 +58,7 @@ class PaginatedTasks(BaseModel):
     total: int
     page: int
     pages: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
 
 
 class TaskStats(BaseModel):
@@ -73,6 +74,12 @@ class TaskStats(BaseModel):
     comments_posted: int = 0
 
 
+class BulkTaskCreate(BaseModel):
+    """Schema for creating multiple tasks at once"""
+
+    tasks: list[TaskCreate] = Field(min_length=1, max_length=100)
+
+
 class BulkTaskUpdate(BaseModel):
     """Schema for bulk updating tasks"""
 
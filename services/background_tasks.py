@@ -9,6 +9,7 @@ from services.notifications import (
     format_comment_added_notification,
     format_task_completed_notification,
     format_task_shared_notification,
+    send_direct_email,
     send_notification,
     should_notify,
 )
@@ -22,29 +23,65 @@ def cleanup_after_task_deletion(task_id: int, task_title: str, file_list: list[s
     Deletes uploaded files from local storage, removes from caches, updates analytics, etc.
     """
     logger.info(
-        f"BACKGROUND TASK: Starting cleanup after task deletion - task_id={task_id}"
+        "BACKGROUND TASK: Starting cleanup after task deletion - task_id=%s", task_id
     )
 
-    # Delete files using storage abstraction
-    files_deleted = 0
-    for stored_filename in file_list:
-        try:
-            storage.delete_file(stored_filename)
-            files_deleted += 1
-            logger.info(f"Deleted file from storage: {stored_filename}")
-        except Exception as e:
-            logger.warning(f"File deletion warning for {stored_filename}: {e}")
+    # Delete files using storage abstraction (batched where the backend allows)
+    files_deleted = storage.delete_files(file_list) if file_list else 0
 
     # Simulate cleanup work
     time.sleep(1)
 
     # Log what we "cleaned up"
     logger.info(
-        f"CLEANUP COMPLETED: Task '{task_title}' (ID: {task_id}) | "
-        f"Removed from cache, deleted {files_deleted} files from storage, updated analytics"
+        "CLEANUP COMPLETED: Task '%s' (ID: %s) | "
+        "Removed from cache, deleted %s files from storage, updated analytics",
+        task_title,
+        task_id,
+        files_deleted,
     )
 
 
+def delete_stored_files(file_list: list[str]):
+    """
+    Background task: Remove files from storage after their DB rows are deleted.
+    Keeps the storage round-trip off the request path.
+    """
+    files_deleted = storage.delete_files(file_list)
+    logger.info(
+        "BACKGROUND TASK: Deleted %s/%s files from storage",
+        files_deleted,
+        len(file_list),
+    )
+
+
+def deliver_verification_email(
+    user_id: int,
+    recipient_email: str,
+    subject: str,
+    body_text: str,
+    body_html: str,
+):
+    """
+    Background task: Send the email verification link.
+    The response has already gone out, so a failed send is only logged;
+    the user can request a new link.
+    """
+    success = send_direct_email(
+        recipient_email=recipient_email,
+        subject=subject,
+        body_text=body_text,
+        body_html=body_html,
+    )
+
+    if success:
+        logger.info("BACKGROUND TASK: Verification email sent to user_id=%s", user_id)
+    else:
+        logger.error(
+            "BACKGROUND TASK: Failed to send verification email to user_id=%s", user_id
+        )
+
+
 def notify_task_shared(
     recipient_user_id: int,
     recipient_email: str,
@@ -56,7 +93,7 @@ def notify_task_shared(
     Background task: Send notification when task is shared.
     """
     logger.info(
-        f"BACKGROUND TASK: Checking notification for user_id={recipient_user_id}"
+        "BACKGROUND TASK: Checking notification for user_id=%s", recipient_user_id
     )
 
     db = SessionLocal()
@@ -64,7 +101,7 @@ def notify_task_shared(
     # 1. Check preferences
     try:
         if not should_notify(recipient_user_id, NotificationType.TASK_SHARED, db):
-            logger.info(f"User {recipient_user_id} blocked task_shared notification")
+            logger.info("User %s blocked task_shared notification", recipient_user_id)
             return
 
         # 2. Format message
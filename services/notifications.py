@@ -50,7 +50,7 @@ def get_or_create_preferences(
     )
 
     if not prefs:
-        logger.info(f"Creating default notification preferences for user_id={user_id}")
+        logger.info("Creating default notification preferences for user_id=%s", user_id)
         prefs = db_models.NotificationPreference(user_id=user_id)
         db_session.add(prefs)
         db_session.commit()
@@ -71,12 +71,12 @@ def should_notify(user_id: int, notification_type: str, db_session: Session) ->
 
     # 1. Check if email is verified
     if not prefs.email_verified:  # type: ignore
-        logger.debug(f"Skipping notification: user_id={user_id} email not verified")
+        logger.debug("Skipping notification: user_id=%s email not verified", user_id)
         return False
 
     # 2. Check if notifications are globally disabled
     if not prefs.email_enabled:  # type: ignore
-        logger.debug(f"Skipping notification: user_id={user_id} has disabled email")
+        logger.debug("Skipping notification: user_id=%s has disabled email", user_id)
         return False
 
     # 3. Check specific notification type
@@ -90,7 +90,7 @@ def should_notify(user_id: int, notification_type: str, db_session: Session) ->
     enabled = type_mapping.get(notification_type, False)
     if not enabled:  # type: ignore
         logger.debug(
-            f"Skipping notification: user_id={user_id} disabled {notification_type}"
+            "Skipping notification: user_id=%s disabled %s", user_id, notification_type
         )
         return False
 
@@ -108,7 +108,9 @@ def send_notification(
     but for simplicity we use direct email for both.
     """
     logger.info(
-        f"Sending notification: type={notification_type}, recipient={recipient_email}"
+        "Sending notification: type=%s, recipient=%s",
+        notification_type,
+        recipient_email,
     )
 
     # Send as plain text email (can be enhanced with HTML templates later)
@@ -132,7 +134,9 @@ def subscribe_user_to_notifications(user_email: str) -> Optional[str]:
     # With Resend, no subscription is needed - emails are sent directly
     # This function is kept for API compatibility but doesn't do anything
     logger.info(
-        f"User {user_email} is ready to receive notifications (no subscription needed with current email provider)"
+        "User %s is ready to receive notifications "
+        "(no subscription needed with current email provider)",
+        user_email,
     )
     return "subscribed"  # Return a dummy value for compatibility
 
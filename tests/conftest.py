@@ -12,12 +12,13 @@ os.environ["TESTING"] = "true"
 if "RESEND_API_KEY" not in os.environ:
     os.environ["RESEND_API_KEY"] = "test_key_for_testing"
 
+from contextlib import contextmanager
 from unittest.mock import patch
 
 import pytest
 import redis
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -57,6 +58,8 @@ def db_session():
     # Create faros schema if it doesn't exist (for schema isolation)
     with test_engine.connect() as conn:
         conn.execute(text("CREATE SCHEMA IF NOT EXISTS faros"))
+        # Trigram operator class used by the task search index
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         conn.commit()
 
     # Create all tables in the test database (in faros schema)
@@ -99,6 +102,25 @@ def client(db_session):
     app.dependency_overrides.clear()
 
 
+# RATE LIMIT FIXTURES
+@pytest.fixture
+def rate_limiting():
+    """
+    Turns the limiter on for one test (it is disabled under TESTING),
+    starting from empty buckets, and switches it back off afterwards.
+    """
+    from core.rate_limit_config import limiter
+
+    app.state.limiter = limiter
+    limiter.reset()
+    limiter.enabled = True
+    try:
+        yield limiter
+    finally:
+        limiter.enabled = False
+        limiter.reset()
+
+
 # AUTHENTICATION FIXTURES
 @pytest.fixture(scope="function")
 def test_user(client):
@@ -187,3 +209,27 @@ def patch_background_tasks_db(db_session):
         "services.background_tasks.SessionLocal", side_effect=test_session_factory
     ):
         yield
+
+
+# QUERY COUNT FIXTURE
+@pytest.fixture(scope="function")
+def count_queries():
+    """
+    Returns a context manager that records every SQL statement run inside it.
+    Used to assert an endpoint's query count doesn't grow with row count (N+1).
+    """
+
+    @contextmanager
+    def _count_queries():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _record)
+
+    return _count_queries
@@ -94,6 +94,45 @@ def test_login_invalid_password(client, test_user):
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+def test_login_rate_limit_is_per_username(client, rate_limiting):
+    """Test that each username from one IP gets its own login bucket"""
+
+    # ARRANGE
+    def attempt(username):
+        return client.post(
+            "/auth/login", json={"username": username, "password": "wrong_password"}
+        )
+
+    # ACT
+    first_five = [attempt("alice").status_code for _ in range(5)]
+    sixth = attempt("alice")
+    other_user = attempt("bob")
+
+    # ASSERT
+    assert first_five == [status.HTTP_401_UNAUTHORIZED] * 5
+    assert sixth.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert other_user.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_login_rate_limit_caps_ip_across_usernames(client, rate_limiting):
+    """Test that spreading attempts over many usernames still hits the IP cap"""
+
+    # ARRANGE
+    def attempt(username):
+        return client.post(
+            "/auth/login", json={"username": username, "password": "wrong_password"}
+        )
+
+    # ACT
+    # One attempt per username keeps every per-username bucket well under 5
+    allowed = [attempt(f"user{i}").status_code for i in range(20)]
+    blocked = attempt("user20")
+
+    # ASSERT
+    assert allowed == [status.HTTP_401_UNAUTHORIZED] * 20
+    assert blocked.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
 def test_change_password_success(authenticated_client):
     """Test successful password change"""
 
@@ -16,8 +16,14 @@ def mock_s3():
     mock_storage = MagicMock()
     mock_storage.upload_file.return_value = None
     mock_storage.download_file.return_value = b"real content"
+    mock_storage.stream_file.side_effect = lambda *args, **kwargs: iter(
+        [b"real content"]
+    )
     mock_storage.delete_file.return_value = None
+    mock_storage.delete_files.return_value = 1
     mock_storage.file_exists.return_value = True
+    # No presigned URL by default, so downloads stream through the API
+    mock_storage.get_file_url.return_value = None
 
     # For local storage, also mock get_file_path
     mock_storage.get_file_path.return_value = MagicMock(exists=lambda: True)
@@ -143,7 +149,160 @@ def test_viewer_can_download_file(client, create_user_and_token, mock_s3):
     # ASSERT
     assert response.status_code == status.HTTP_200_OK
     assert response.content == b"real content"
-    mock_s3.download_file.assert_called_once()
+    mock_s3.stream_file.assert_called_once()
+
+
+def test_local_text_download_is_gzipped(client, create_user_and_token, tmp_path):
+    """Test that locally stored text files are gzipped only when accepted"""
+    from core.storage import LocalStorage
+
+    # ARRANGE
+    local_storage = LocalStorage(upload_dir=str(tmp_path))
+    with patch("routers.files.storage", local_storage):
+        alice_token = create_user_and_token("alice", "alice@test.com", "password")
+        task = client.post(
+            "/tasks",
+            json={"title": "Gzip Task", "priority": "low"},
+            headers={"Authorization": f"Bearer {alice_token}"},
+        ).json()
+        upload_res = client.post(
+            f"/tasks/{task['id']}/files",
+            files={"file": ("notes.txt", b"real content " * 100, "text/plain")},
+            headers={"Authorization": f"Bearer {alice_token}"},
+        )
+        file_id = upload_res.json()["id"]
+
+        # ACT
+        gzipped = client.get(
+            f"/files/{file_id}",
+            headers={
+                "Authorization": f"Bearer {alice_token}",
+                "Accept-Encoding": "gzip",
+            },
+        )
+        identity = client.get(
+            f"/files/{file_id}",
+            headers={
+                "Authorization": f"Bearer {alice_token}",
+                "Accept-Encoding": "identity",
+            },
+        )
+
+    # ASSERT
+    assert gzipped.status_code == status.HTTP_200_OK
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+    assert gzipped.content == b"real content " * 100
+
+    assert identity.status_code == status.HTTP_200_OK
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["vary"] == "Accept-Encoding"
+    assert identity.content == b"real content " * 100
+
+
+def test_gzipped_download_encodes_non_ascii_filename(
+    client, create_user_and_token, tmp_path
+):
+    """Test that a gzipped download with a non-ASCII name gets an RFC 5987 header"""
+    from core.storage import LocalStorage
+
+    # ARRANGE
+    local_storage = LocalStorage(upload_dir=str(tmp_path))
+    with patch("routers.files.storage", local_storage):
+        alice_token = create_user_and_token("alice", "alice@test.com", "password")
+        task = client.post(
+            "/tasks",
+            json={"title": "Unicode Task", "priority": "low"},
+            headers={"Authorization": f"Bearer {alice_token}"},
+        ).json()
+        upload_res = client.post(
+            f"/tasks/{task['id']}/files",
+            files={"file": ("résumé.txt", b"real content " * 100, "text/plain")},
+            headers={"Authorization": f"Bearer {alice_token}"},
+        )
+        file_id = upload_res.json()["id"]
+
+        # ACT
+        response = client.get(
+            f"/files/{file_id}",
+            headers={
+                "Authorization": f"Bearer {alice_token}",
+                "Accept-Encoding": "gzip",
+            },
+        )
+
+    # ASSERT
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-disposition"] == (
+        "attachment; filename=\"rsum.txt\"; filename*=utf-8''r%C3%A9sum%C3%A9.txt"
+    )
+    assert response.content == b"real content " * 100
+
+
+def test_download_redirects_to_presigned_url(client, create_user_and_token, mock_s3):
+    """Test that downloads redirect to a presigned URL when storage provides one"""
+
+    # ARRANGE
+    alice_token = create_user_and_token("alice", "alice@test.com", "password")
+    task = client.post(
+        "/tasks",
+        json={"title": "Redirect Task", "priority": "low"},
+        headers={"Authorization": f"Bearer {alice_token}"},
+    ).json()
+    upload_res = client.post(
+        f"/tasks/{task['id']}/files",
+        files={"file": ("report.pdf", b"%PDF-1.4", "application/pdf")},
+        headers={"Authorization": f"Bearer {alice_token}"},
+    )
+    file_id = upload_res.json()["id"]
+    mock_s3.get_file_url.return_value = "https://bucket.s3.amazonaws.com/signed"
+
+    # ACT
+    response = client.get(
+        f"/files/{file_id}",
+        headers={"Authorization": f"Bearer {alice_token}"},
+        follow_redirects=False,
+    )
+
+    # ASSERT
+    assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+    assert response.headers["location"] == "https://bucket.s3.amazonaws.com/signed"
+    mock_s3.stream_file.assert_not_called()
+
+
+def test_local_download_supports_range_requests(
+    client, create_user_and_token, tmp_path
+):
+    """Test that local downloads honor Range so clients can resume"""
+    from core.storage import LocalStorage
+
+    # ARRANGE
+    local_storage = LocalStorage(upload_dir=str(tmp_path))
+    with patch("routers.files.storage", local_storage):
+        alice_token = create_user_and_token("alice", "alice@test.com", "password")
+        task = client.post(
+            "/tasks",
+            json={"title": "Range Task", "priority": "low"},
+            headers={"Authorization": f"Bearer {alice_token}"},
+        ).json()
+        upload_res = client.post(
+            f"/tasks/{task['id']}/files",
+            files={"file": ("notes.txt", b"0123456789", "text/plain")},
+            headers={"Authorization": f"Bearer {alice_token}"},
+        )
+        file_id = upload_res.json()["id"]
+
+        # ACT
+        response = client.get(
+            f"/files/{file_id}",
+            headers={"Authorization": f"Bearer {alice_token}", "Range": "bytes=2-5"},
+        )
+
+    # ASSERT
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert response.content == b"2345"
+    assert response.headers["content-range"] == "bytes 2-5/10"
 
 
 # --- Editor Can Delete ---
@@ -185,4 +344,4 @@ def test_editor_can_delete_file(client, create_user_and_token, mock_s3):
 
     # ASSERT
     assert response.status_code == status.HTTP_204_NO_CONTENT
-    mock_s3.delete_file.assert_called_once()
+    mock_s3.delete_files.assert_called_once()
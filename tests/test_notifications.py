@@ -266,3 +266,39 @@ def test_notification_guards(client, create_user_and_token, mock_sns):
         headers={"Authorization": f"Bearer {user_a_token}"},
     )
     mock_sns.send_email.assert_not_called()
+
+
+def test_verify_attempts_share_rate_limit(client, rate_limiting):
+    """Test that GET and POST verification share one 5/minute attempt bucket"""
+
+    # ARRANGE - Use up the bucket, alternating between the two endpoints
+    for attempt in range(5):
+        if attempt % 2:
+            response = client.post("/notifications/verify", json={"token": "bad"})
+        else:
+            response = client.get("/notifications/verify", params={"token": "bad"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    # ACT - A 6th attempt on either endpoint
+    post_response = client.post("/notifications/verify", json={"token": "bad"})
+    get_response = client.get("/notifications/verify", params={"token": "bad"})
+
+    # ASSERT
+    assert post_response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert get_response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+def test_send_verification_rate_limit(authenticated_client, mock_sns, rate_limiting):
+    """Test that a user can request at most 5 verification emails per hour"""
+
+    # ARRANGE - Use up the hourly bucket
+    for _ in range(5):
+        response = authenticated_client.post("/notifications/send-verification")
+        assert response.status_code == status.HTTP_200_OK
+
+    # ACT - A 6th request within the hour
+    response = authenticated_client.post("/notifications/send-verification")
+
+    # ASSERT
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert mock_sns.send_email.call_count == 5
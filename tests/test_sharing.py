@@ -218,3 +218,48 @@ def test_update_share_permission(client, create_user_and_token):
     assert update_response.status_code == status.HTTP_200_OK
     data = update_response.json()
     assert data["permission"] == "edit"
+
+
+def test_shared_with_me_query_count_is_constant(
+    client, create_user_and_token, count_queries
+):
+    """Test that listing shared tasks doesn't issue a query per shared task"""
+
+    # ARRANGE
+    alice_token = create_user_and_token("alice", "alice@test.com", "password123")
+    bob_token = create_user_and_token("bob", "bob@test.com", "password456")
+    alice_headers = {"Authorization": f"Bearer {alice_token}"}
+    bob_headers = {"Authorization": f"Bearer {bob_token}"}
+
+    def share_new_task(title):
+        task_id = client.post(
+            "/tasks", json={"title": title, "priority": "low"}, headers=alice_headers
+        ).json()["id"]
+        client.post(
+            f"/tasks/{task_id}/comments",
+            json={"content": f"Comment on {title}"},
+            headers=alice_headers,
+        )
+        client.post(
+            f"/tasks/{task_id}/share",
+            json={"shared_with_username": "bob", "permission": "view"},
+            headers=alice_headers,
+        )
+
+    share_new_task("Task 1")
+    with count_queries() as one_share:
+        response = client.get("/tasks/shared-with-me", headers=bob_headers)
+    assert len(response.json()) == 1
+
+    for i in range(2, 6):
+        share_new_task(f"Task {i}")
+
+    # ACT
+    with count_queries() as five_shares:
+        response = client.get("/tasks/shared-with-me", headers=bob_headers)
+
+    # ASSERT
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 5
+    assert all(len(item["task"]["comments"]) == 1 for item in response.json())
+    assert len(five_shares) == len(one_share)
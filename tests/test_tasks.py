@@ -1,4 +1,7 @@
 from fastapi import status
+from sqlalchemy import update
+
+import db_models
 
 
 def test_create_task_successfully(authenticated_client):
@@ -318,6 +321,59 @@ def test_update_task_invalid_priority(authenticated_client):
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+def test_task_list_cache_invalidated_on_update(authenticated_client):
+    """Test that a cached unfiltered task list reflects later updates"""
+
+    # ARRANGE - Create a task and prime the cached list
+    create_response = authenticated_client.post(
+        "/tasks", json={"title": "Original title", "priority": "low"}
+    )
+    task_id = create_response.json()["id"]
+    first = authenticated_client.get("/tasks")
+    assert first.json()["tasks"][0]["title"] == "Original title"
+
+    # ACT
+    authenticated_client.patch(f"/tasks/{task_id}", json={"title": "Updated title"})
+    response = authenticated_client.get("/tasks")
+
+    # ASSERT
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total"] == 1
+    assert data["tasks"][0]["title"] == "Updated title"
+
+
+def test_get_tasks_query_count_is_constant(authenticated_client, count_queries):
+    """Test that listing tasks doesn't issue a query per task"""
+
+    # ARRANGE
+    def create_task_with_comment(title):
+        task_id = authenticated_client.post(
+            "/tasks", json={"title": title, "priority": "low"}
+        ).json()["id"]
+        authenticated_client.post(
+            f"/tasks/{task_id}/comments", json={"content": f"Comment on {title}"}
+        )
+
+    create_task_with_comment("Task 1")
+    with count_queries() as one_task:
+        response = authenticated_client.get("/tasks")
+    assert response.json()["total"] == 1
+
+    for i in range(2, 6):
+        create_task_with_comment(f"Task {i}")
+
+    # ACT
+    with count_queries() as five_tasks:
+        response = authenticated_client.get("/tasks")
+
+    # ASSERT
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] == 5
+    assert all(len(task["comments"]) == 1 for task in response.json()["tasks"])
+    assert len(five_tasks) == len(one_task)
+
+
 def test_filter_tasks_by_completed(authenticated_client):
     """Test filtering tasks by completed status"""
 
@@ -420,9 +476,58 @@ def test_sort_tasks_by_priority(authenticated_client):
 
     # ASSERT
     assert response.status_code == status.HTTP_200_OK
-    tasks = response.json()
-    # Check order: low, medium, high (alphabetically if your sort works that way)
-    # Or adjust based on how your API actually sorts priorities
+    titles = [task["title"] for task in response.json()["tasks"]]
+    # Priorities sort by rank (low, medium, high), not alphabetically
+    assert titles == ["Low task", "Medium task", "High task"]
+
+
+def test_cursor_pagination(authenticated_client):
+    """Test paging through tasks with next_cursor"""
+
+    # ARRANGE - Create 5 tasks with a tie on priority
+    for i, priority in enumerate(["high", "low", "medium", "low", "high"]):
+        authenticated_client.post(
+            "/tasks", json={"title": f"Task {i+1}", "priority": priority}
+        )
+
+    # ACT - Walk all pages, 2 tasks at a time
+    seen = []
+    response = authenticated_client.get("/tasks?sort_by=priority&limit=2")
+    pages = 1
+    while response.json()["next_cursor"]:
+        seen += response.json()["tasks"]
+        response = authenticated_client.get(
+            "/tasks",
+            params={
+                "sort_by": "priority",
+                "limit": 2,
+                "cursor": response.json()["next_cursor"],
+            },
+        )
+        pages += 1
+    seen += response.json()["tasks"]
+
+    # ASSERT
+    assert response.status_code == status.HTTP_200_OK
+    assert pages == 3
+    assert [task["priority"] for task in seen] == [
+        "low",
+        "low",
+        "medium",
+        "high",
+        "high",
+    ]
+    assert len({task["id"] for task in seen}) == 5
+
+
+def test_invalid_cursor_rejected(authenticated_client):
+    """Test that a malformed cursor returns 400"""
+
+    # ACT
+    response = authenticated_client.get("/tasks?cursor=not-a-cursor")
+
+    # ASSERT
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
 def test_pagination(authenticated_client):
@@ -453,6 +558,26 @@ def test_pagination(authenticated_client):
     assert len(tasks) == 2
 
 
+def test_pagination_total_past_last_page(authenticated_client):
+    """Test that total is still reported when skip is past the last task"""
+
+    # ARRANGE - Create 3 tasks
+    for i in range(3):
+        authenticated_client.post(
+            "/tasks", json={"title": f"Task {i+1}", "priority": "low"}
+        )
+
+    # ACT
+    first_page = authenticated_client.get("/tasks?skip=0&limit=2").json()
+    past_end = authenticated_client.get("/tasks?skip=10&limit=2").json()
+
+    # ASSERT
+    assert first_page["total"] == 3
+    assert first_page["pages"] == 2
+    assert past_end["tasks"] == []
+    assert past_end["total"] == 3
+
+
 def test_combine_multiple_filters(authenticated_client):
     """Test combining multiple query parameters"""
 
@@ -559,6 +684,31 @@ def test_stats_only_shows_user_tasks(client, create_user_and_token):
     assert stats["total"] == 3  # Not 5!
 
 
+def test_bulk_create_tasks(authenticated_client):
+    """Test creating multiple tasks at once"""
+
+    # ARRANGE
+    bulk_create = {
+        "tasks": [
+            {"title": "Task 1", "priority": "low"},
+            {"title": "Task 2", "priority": "high", "tags": ["work"]},
+        ]
+    }
+
+    # ACT
+    response = authenticated_client.post("/tasks/bulk", json=bulk_create)
+
+    # ASSERT
+    assert response.status_code == status.HTTP_201_CREATED
+    created_tasks = response.json()
+    assert [task["title"] for task in created_tasks] == ["Task 1", "Task 2"]
+    assert created_tasks[1]["tags"] == ["work"]
+    assert all(task["id"] and task["created_at"] for task in created_tasks)
+
+    list_response = authenticated_client.get("/tasks")
+    assert list_response.json()["total"] == 2
+
+
 def test_bulk_update_tasks(authenticated_client):
     """Test updating multiple tasks at once"""
 
@@ -593,6 +743,54 @@ def test_bulk_update_tasks(authenticated_client):
         assert task["priority"] == "high"
 
 
+def test_bulk_update_respects_share_permission(client, create_user_and_token):
+    """Test that bulk update works on tasks shared with edit, but not view"""
+
+    # ARRANGE - Alice shares one task with Bob for edit and one for view
+    alice_token = create_user_and_token("alice", "alice@test.com", "password123")
+    bob_token = create_user_and_token("bob", "bob@test.com", "password456")
+    alice_headers = {"Authorization": f"Bearer {alice_token}"}
+    bob_headers = {"Authorization": f"Bearer {bob_token}"}
+
+    task_ids = {}
+    for permission in ("edit", "view"):
+        task_ids[permission] = client.post(
+            "/tasks",
+            json={"title": f"Shared for {permission}", "priority": "low"},
+            headers=alice_headers,
+        ).json()["id"]
+        client.post(
+            f"/tasks/{task_ids[permission]}/share",
+            json={"shared_with_username": "bob", "permission": permission},
+            headers=alice_headers,
+        )
+
+    # --- SCENARIO 1: Edit share (200) ---
+    # ACT
+    edit_response = client.patch(
+        "/tasks/bulk",
+        json={"task_ids": [task_ids["edit"]], "updates": {"completed": True}},
+        headers=bob_headers,
+    )
+
+    # ASSERT
+    assert edit_response.status_code == status.HTTP_200_OK
+    assert edit_response.json()[0]["completed"] == True
+
+    # --- SCENARIO 2: View share (403) ---
+    # ACT
+    view_response = client.patch(
+        "/tasks/bulk",
+        json={"task_ids": [task_ids["view"]], "updates": {"completed": True}},
+        headers=bob_headers,
+    )
+
+    # ASSERT
+    assert view_response.status_code == status.HTTP_403_FORBIDDEN
+    task = client.get(f"/tasks/{task_ids['view']}", headers=alice_headers).json()
+    assert task["completed"] == False
+
+
 def test_bulk_update_with_invalid_id_fails(client, create_user_and_token):
     """Test that bulk update fails if any task ID is invalid"""
 
@@ -718,6 +916,57 @@ def test_add_duplicate_tag(authenticated_client):
     assert task["tags"].count("urgent") == 1
 
 
+def test_add_tags_keeps_order_and_skips_existing(authenticated_client):
+    """Test that only missing tags are appended, in request order"""
+
+    # ARRANGE
+    task_response = authenticated_client.post(
+        "/tasks", json={"title": "Task", "priority": "low", "tags": ["work"]}
+    )
+    task_id = task_response.json()["id"]
+
+    # ACT
+    response = authenticated_client.post(
+        f"/tasks/{task_id}/tags", json=["urgent", "work", "home", "urgent"]
+    )
+
+    # ASSERT
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["tags"] == ["work", "urgent", "home"]
+
+
+def test_add_tags_dedupes_against_stored_row(client, db_session, create_user_and_token):
+    """Test that a tag already in the row isn't appended again, even if the
+    server's loaded copy of the task is stale (as with a concurrent add)"""
+
+    # ARRANGE
+    token = create_user_and_token("alice", "alice@test.com", "password")
+    headers = {"Authorization": f"Bearer {token}"}
+    task_id = client.post(
+        "/tasks",
+        json={"title": "Task", "priority": "low", "tags": ["work"]},
+        headers=headers,
+    ).json()["id"]
+
+    # Load the task into the session, then add "urgent" behind its back
+    assert db_session.get(db_models.Task, task_id).tags == ["work"]
+    db_session.execute(
+        update(db_models.Task)
+        .where(db_models.Task.id == task_id)
+        .values(tags=["work", "urgent"])
+        .execution_options(synchronize_session=False)
+    )
+
+    # ACT
+    response = client.post(
+        f"/tasks/{task_id}/tags", json=["urgent", "home"], headers=headers
+    )
+
+    # ASSERT
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["tags"] == ["work", "urgent", "home"]
+
+
 def test_remove_tag_from_task(authenticated_client):
     """Test removing a tag from a task"""
 